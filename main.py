@@ -5,6 +5,13 @@ Signal & Strategy: The Minion's Quest - Main Entry Point
 import sys
 import os
 import argparse
+import logging
+
+# The per-frame numpy work is on tiny arrays; keep BLAS/OpenMP pools from spinning up a thread per core
+# next to the asyncio loop. Must be set before numpy is first imported (via src.game).
+for _var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_var, "1")
+
 from src.game import Game
 
 def create_env_file(api_key):
@@ -23,9 +30,13 @@ if __name__ == "__main__":
     parser.add_argument("--openai", "-o", action="store_true", help="Use OpenAI for minion decisions")
     parser.add_argument("--api-key", "-k", help="Set OpenAI API key (will be saved to .env file)")
     parser.add_argument("--create-env", "-e", action="store_true", help="Create a template .env file")
+    parser.add_argument("--debug", "-d", action="store_true", help="Log full AI prompts and responses")
     
     args = parser.parse_args()
     
+    # Per-turn AI dumps are only emitted at DEBUG level
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO)
+    
     # Handle API key argument
     if args.api_key:
         api_key = args.api_key
@@ -2,6 +2,7 @@
 AI Prompts and Tools for the Signal & Strategy game.
 Contains prompts, tools, and configurations for all OpenAI calls.
 """
+import functools
 
 from src.utils.constants import TEAM1_MINION_1, TEAM1_MINION_2, TEAM2_MINION_1, TEAM2_MINION_2
 
@@ -156,11 +157,11 @@ def create_minion_prompt(minion, grid, gesture, collected_items, target_items=No
     
     # Personality object to send to the AI
     personality = {
-        "propensity_to_listen": minion.personality["propensity_to_listen"],
-        "intelligence": minion.personality["intelligence"],
-        "speed": minion.personality.get("speed", 3),
-        "power": minion.personality.get("power", 3),
-        "style": minion.personality["style"]
+        "propensity_to_listen": minion.personality.propensity_to_listen,
+        "intelligence": minion.personality.intelligence,
+        "speed": minion.personality.speed,
+        "power": minion.personality.power,
+        "style": minion.personality.style
     }
     
     # Build the prompt
@@ -179,33 +180,24 @@ def create_minion_prompt(minion, grid, gesture, collected_items, target_items=No
         
     return prompt
     
+# Map symbol for each grid code, as seen by team 1 and team 2 (T = teammate, O = opponent)
+_CELL_SYMBOLS = {
+    1: {0: "0", 1: "S", 2: "D", 3: "B", TEAM1_MINION_1: "T", TEAM1_MINION_2: "T", TEAM2_MINION_1: "O", TEAM2_MINION_2: "O"},
+    2: {0: "0", 1: "S", 2: "D", 3: "B", TEAM2_MINION_1: "T", TEAM2_MINION_2: "T", TEAM1_MINION_1: "O", TEAM1_MINION_2: "O"},
+}
+
+@functools.lru_cache(maxsize=4)
+def team_grid_symbols(grid, team_id):
+    """Translate a tuple-of-tuples grid snapshot to map symbols once per team"""
+    symbols = _CELL_SYMBOLS[team_id]
+    return tuple(tuple(symbols.get(cell, "?") for cell in row) for row in grid)
+
 def format_grid_for_prompt(grid, minion_pos, team_id):
     """Format the grid into a 2D array for prompt"""
-    result = []
-    for y in range(len(grid)):
-        row = []
-        for x in range(len(grid[0])):
-            cell = grid[y][x]
-            # Mark the minion's position
-            if y == minion_pos[0] and x == minion_pos[1]:
-                row.append("Y") # your position
-            elif cell == 0:
-                row.append("0")  # Empty
-            elif cell == 1:
-                row.append("S")  # Sushi
-            elif cell == 2:
-                row.append("D")  # Donut
-            elif cell == 3:
-                row.append("B")  # Banana
-            elif team_id == 1 and (cell == TEAM1_MINION_1 or cell == TEAM1_MINION_2):
-                row.append("T")  # Your teammate
-            elif team_id == 1 and (cell == TEAM2_MINION_1 or cell == TEAM2_MINION_2):
-                row.append("O")  # Your Opponents   
-            elif team_id == 2 and (cell == TEAM2_MINION_1 or cell == TEAM2_MINION_2):
-                row.append("T")  # Your Opponents
-            elif team_id == 2 and (cell == TEAM1_MINION_1 or cell == TEAM1_MINION_2):
-                row.append("O")  # Your teammate
-            else:
-                row.append("?")
-        result.append(row)
+    # Both minions of a team share the same turn snapshot, so only the first one pays for the translation
+    result = [list(row) for row in team_grid_symbols(grid, team_id)]
+    # Mark the minion's position
+    y, x = int(minion_pos[0]), int(minion_pos[1])
+    if 0 <= y < len(result) and 0 <= x < len(result[0]):
+        result[y][x] = "Y" # your position
     return result 
\ No newline at end of file
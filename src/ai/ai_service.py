@@ -3,10 +3,10 @@ import openai
 from dotenv import load_dotenv
 import json
 import logging
+from collections import OrderedDict
 from src.ai.ai_prompts import MINION_SYSTEM_PROMPT, MINION_DECISION_TOOL, create_minion_prompt
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by main.py
 logger = logging.getLogger(__name__)
 
 # Find and load environment variables from .env file
@@ -33,6 +33,15 @@ class AIService:
             self.client = None
             
         self.model = "gpt-4o"  # Default model, can be changed to gpt-4 for better reasoning
+
+        # LRU cache of decisions keyed by the serialized prompt, so a repeated board state skips the API call.
+        # Entries are [decision, times reused]; a minion that stays put sees the same prompt next turn, so an
+        # entry is dropped after a few reuses to let the model pick something else instead of looping forever
+        self.decision_cache = OrderedDict()
+        self.decision_cache_size = 1024
+        self.decision_cache_max_reuse = 2
+        self.cache_hits = 0
+        self.cache_misses = 0
         
     async def get_minion_action(self, minion, grid, gesture, collected_items, target_items=None):
         """
@@ -60,25 +69,31 @@ class AIService:
         # Create a prompt for the minion using the new prompt creator
         user_prompt = create_minion_prompt(minion, grid, gesture, collected_items, target_items)
         
-        # Log the full prompt for debugging
-        print("\n" + "="*80)
-        print(f"Minion {minion.name} PROMPT:")
-        print("="*80)
-        print("GESTURE:", user_prompt["gesture"])
-        print("\nINSTRUCTIONS:")
-        for inst in user_prompt["instructions"]:
-            print(f"- {inst}")
-        print("\nPERSONALITY:", json.dumps(user_prompt["personality"], indent=2))
-        print("\nCOLLECTED ITEMS:", user_prompt["collected_items"])
-        if "debug_target_items" in user_prompt:
-            print("\nTARGET ITEMS:", user_prompt["debug_target_items"])
-        print("\nMAP:")
-        for row in user_prompt["map"]:
-            print(" ".join(row))
-        print("="*80)
+        # Dump the full prompt only when debugging; this runs on the AI thread every turn
+        if logger.isEnabledFor(logging.DEBUG):
+            map_text = "\n".join(" ".join(row) for row in user_prompt["map"])
+            logger.debug("Minion %s PROMPT:\nGESTURE: %s\nINSTRUCTIONS: %s\nPERSONALITY: %s\nCOLLECTED ITEMS: %s\nTARGET ITEMS: %s\nMAP:\n%s",
+                         minion.name, user_prompt["gesture"], user_prompt["instructions"],
+                         user_prompt["personality"], user_prompt["collected_items"],
+                         user_prompt.get("debug_target_items"), map_text)
+        
+        # The prompt holds everything the decision depends on (map incl. own position, gesture, personality, items)
+        prompt_json = json.dumps(user_prompt)
+        entry = self.decision_cache.get(prompt_json)
+        if entry is not None:
+            decision, reused = entry
+            if reused < self.decision_cache_max_reuse:
+                entry[1] = reused + 1
+                self.decision_cache.move_to_end(prompt_json)
+                self.cache_hits += 1
+                logger.debug("Reusing cached decision for Minion %s (hit rate %d/%d)", minion.name,
+                             self.cache_hits, self.cache_hits + self.cache_misses)
+                return dict(decision)
+            # Used up: ask the model again and cache its fresh answer below
+            del self.decision_cache[prompt_json]
+        self.cache_misses += 1
         
-        logger.info(f"Making OpenAI API call for Minion {minion.name}")
-        logger.debug(f"Prompt: {json.dumps(user_prompt, indent=2)}")
+        logger.info("Making OpenAI API call for Minion %s", minion.name)
         
         try:
             # Call OpenAI API with function calling and our new system prompt
@@ -87,7 +102,7 @@ class AIService:
                 model=self.model,
                 messages=[
                     {"role": "system", "content": MINION_SYSTEM_PROMPT},
-                    {"role": "user", "content": json.dumps(user_prompt)}
+                    {"role": "user", "content": prompt_json}
                 ],
                 tools=[MINION_DECISION_TOOL],
                 tool_choice={"type": "function", "function": {"name": "decide_next_action"}}
@@ -97,25 +112,24 @@ class AIService:
             if response.choices[0].message.tool_calls:
                 tool_call = response.choices[0].message.tool_calls[0]
                 result = json.loads(tool_call.function.arguments)
-                logger.info(f"Received response from OpenAI: {json.dumps(result, indent=2)}")
-                
                 # Print the response for debugging
-                print("\n" + "="*80)
-                print(f"MINION {minion.name} RESPONSE:")
-                print("="*80)
-                print("MOVE:", result.get("next_move", "stay"))
-                print("\nSTRATEGY:", result.get("strategy", "No strategy available"))
-                print("\nDIALOGUE:", result.get("dialogue", "..."))
-                print("\nTHOUGHT:", result.get("thought", "..."))
-                print("="*80 + "\n")
+                logger.debug("Minion %s RESPONSE:\nMOVE: %s\nSTRATEGY: %s\nDIALOGUE: %s\nTHOUGHT: %s",
+                             minion.name, result.get("next_move", "stay"),
+                             result.get("strategy", "No strategy available"),
+                             result.get("dialogue", "..."), result.get("thought", "..."))
                 
                 # Map from the new response format to the old one
-                return {
+                decision = {
                     "move": result.get("next_move", "stay"),
                     "dialogue": result.get("dialogue", "..."),
                     "thought": result.get("thought", "..."),
                     "strategy": result.get("strategy", "No strategy available")
                 }
+                # Only real answers are cached, never the fallbacks below
+                self.decision_cache[prompt_json] = [decision, 0]
+                if len(self.decision_cache) > self.decision_cache_size:
+                    self.decision_cache.popitem(last=False)
+                return dict(decision)
                 
             # Fallback in case function calling fails
             logger.warning("No tool calls in response. Using fallback response.")
@@ -1,6 +1,7 @@
 """
 OpenAI-based gesture recognition
 """
+import asyncio
 import cv2
 import base64
 from openai import AsyncOpenAI 
@@ -8,6 +9,9 @@ import numpy as np
 import pygame
 import os
 
+# JPEG quality for frames sent to the vision model; high enough to keep hand shapes and expressions crisp
+JPEG_QUALITY = 85
+
 class GestureRecognizer:
     def __init__(self, api_key=None):
         self.last_frame_team1 = None
@@ -22,36 +26,44 @@ class GestureRecognizer:
             # api_type_to_use = os.getenv("OPENAI_API_TYPE", "openai")
             self.client = AsyncOpenAI(api_key=self.api_key)
         
-    def capture_frame(self, team, frame_rgb):
+    def capture_frame(self, team, frame_bgr):
         """Save the captured frame for analysis"""
-        if frame_rgb is None or frame_rgb.size == 0:
+        if frame_bgr is None or frame_bgr.size == 0:
             print("Warning: GestureRecognizer.capture_frame received an empty or None frame.")
             self.last_frame_team1 = None
             self.last_frame_team2 = None
             return None
         
         try:
-            # Build the pygame surface for the thumbnail
-            flipped_frame = np.flipud(frame_rgb)  # flip Y so it isn't upside-down
-            captured_preview_surface = pygame.surfarray.make_surface(flipped_frame)
-            filename = f"capture_team{team}.png"            # e.g. capture_team1.png
-            # Rotate frame_rgb with  90 ° clockwise rotation
-            rotate_frame = np.rot90(frame_rgb, k=-1)
+            # frame_bgr is a column slice of the live webcam frame, so keep our own contiguous copy of just this half
+            half_frame = np.ascontiguousarray(frame_bgr)
+            # Build the pygame surface for the thumbnail straight from the (H, W, 3) BGR buffer, converted once
+            # to the display format since the preview is blitted every frame until the next capture
+            height, width, _channels = half_frame.shape
+            captured_preview_surface = pygame.image.frombuffer(half_frame, (width, height), "BGR").convert()
 
             if team == 1:
-                self.last_frame_team1 = rotate_frame
+                self.last_frame_team1 = half_frame
             if team == 2:
-                self.last_frame_team2 = rotate_frame
+                self.last_frame_team2 = half_frame
 
         except ValueError as e:
             print(f"Error processing frame in GestureRecognizer.capture_frame: {e}")
-            print(f"Offending frame_rgb shape: {getattr(frame_rgb, 'shape', 'N/A')}, dtype: {getattr(frame_rgb, 'dtype', 'N/A')}, size: {getattr(frame_rgb, 'size', 'N/A')}")
+            print(f"Offending frame_bgr shape: {getattr(frame_bgr, 'shape', 'N/A')}, dtype: {getattr(frame_bgr, 'dtype', 'N/A')}, size: {getattr(frame_bgr, 'size', 'N/A')}")
             self.last_frame_team1 = None
             self.last_frame_team2 = None
             return None
         
         return captured_preview_surface
     
+    def encode_frame(self, frame_bgr, filename):
+        """JPEG-encode a frame, save a debug copy to filename and return it base64-encoded"""
+        # JPEG is a fraction of PNG's encode time and upload size for a photo
+        _, jpg = cv2.imencode(".jpg", frame_bgr, [int(cv2.IMWRITE_JPEG_QUALITY), JPEG_QUALITY])
+        # The debug copy on disk reuses the encoded bytes
+        jpg.tofile(filename)
+        return base64.b64encode(jpg.tobytes()).decode()
+    
     async def analyze_gesture(self, team) -> str:
         """Send the captured frame to GPT-4o Vision and get the gesture"""
         if self.last_frame_team1 is None or self.last_frame_team1.size == 0:
@@ -82,19 +94,17 @@ class GestureRecognizer:
         )
         
         try:
-            # Convert the RGB frame to BGR for OpenCV
+            # Frames are already in OpenCV's BGR order
             if team == 1:
-                frame_bgr = cv2.cvtColor(self.last_frame_team1, cv2.COLOR_RGB2BGR)
+                frame_bgr = self.last_frame_team1
             if team == 2:
-                frame_bgr = cv2.cvtColor(self.last_frame_team2, cv2.COLOR_RGB2BGR)
+                frame_bgr = self.last_frame_team2
             
 
-            filename = f"capture_team{team}.png"            # e.g. capture_team1.png
-            # flipped_frame is RGB; OpenCV expects BGR for writing
-            cv2.imwrite(filename, cv2.cvtColor(self.last_frame_team1, cv2.COLOR_RGB2BGR))
-            # Encode the image as PNG
-            _, png = cv2.imencode(".png", frame_bgr)
-            b64_data = base64.b64encode(png.tobytes()).decode()
+            filename = f"capture_team{team}.jpg"            # e.g. capture_team1.jpg
+            # Encoding and the disk write go to the loop's executor so they stall neither the
+            # other in-flight request nor the game loop thread
+            b64_data = await asyncio.get_running_loop().run_in_executor(None, self.encode_frame, frame_bgr, filename)
             
             # Call the OpenAI API
             response = await self.client.chat.completions.create(
@@ -109,7 +119,7 @@ class GestureRecognizer:
                             {
                                 "type": "image_url",
                                 "image_url": {
-                                    "url": f"data:image/png;base64,{b64_data}",
+                                    "url": f"data:image/jpeg;base64,{b64_data}",
                                     "detail": "auto"
                                 }
                             }
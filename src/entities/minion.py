@@ -1,4 +1,23 @@
 import random
+import logging
+from dataclasses import dataclass, replace
+
+@dataclass(slots=True, frozen=True)
+class Personality:
+    """Fixed personality traits sent to the AI with every decision"""
+    propensity_to_listen: float
+    intelligence: int
+    speed: int
+    power: int
+    style: str
+
+# Personality for team 1 minions
+TEAM1_PERSONALITY = Personality(propensity_to_listen=0.8, intelligence=4, speed=3, power=3, style="bubbly")
+
+# Personality for team 2 minions
+TEAM2_PERSONALITY = Personality(propensity_to_listen=0.7, intelligence=3, speed=4, power=2, style="hectic")
+
+logger = logging.getLogger(__name__)
 
 class Minion:
     def __init__(self, team_id, grid_pos, power, name, personality, instructions=None):
@@ -9,8 +28,8 @@ class Minion:
         self.power = power
         # Set personality traits (or generate random)
         
-        self.personality = personality
-        self.personality["power"] = power
+        # Personalities are shared and immutable, so derive one carrying this minion's power
+        self.personality = replace(personality, power=power)
             
         # Store received gestures
         self.last_gesture = None
@@ -42,21 +61,21 @@ class Minion:
         # Store the gesture as the last_gesture to be used in decision making
         if gesture and gesture.lower() != "unknown":
             self.last_gesture = gesture
-            print(f"Minion {self.name} received new gesture: {gesture}")
+            logger.info("Minion %s received new gesture: %s", self.name, gesture)
             return True
         else:
-            print(f"Minion {self.name} received unclear gesture")
+            logger.info("Minion %s received unclear gesture", self.name)
             return False
     
     async def decide_move(self, grid, ai_service=None, collected_items=None, target_items=None):
         """Decide next move based on personality and grid state"""
         # Get AI response and cache it for both move and dialogue
-        print(f"Minion {self.name} last gesture: {self.last_gesture}")
+        logger.debug("Minion %s last gesture: %s", self.name, self.last_gesture)
         self.ai_response = await ai_service.get_minion_action(
             self, 
             grid, 
             self.last_gesture or "no gesture", 
-            collected_items or [],
+            collected_items or (),
             target_items
         )
         return self.ai_response
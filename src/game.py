@@ -8,28 +8,86 @@ import numpy as np
 import random
 import os
 import asyncio, threading
+import concurrent.futures
+import types
+import time
+import logging
 
 from src.utils.constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE, GRID_WIDTH, GRID_HEIGHT,
-    WEBCAM_WIDTH, WEBCAM_HEIGHT, PREVIEW_GAP, BLACK, WHITE,
+    SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE, GRID_WIDTH, GRID_HEIGHT, BOARD_X, BOARD_Y,
+    WEBCAM_WIDTH, WEBCAM_HEIGHT, WEBCAM_FPS, PREVIEW_GAP, BLACK, WHITE,
     BUTTON_COLOR, BUTTON_HOVER_COLOR, GRADIENT_COLORS, EMPTY,
+    MOVE_CODES, MOVE_STAY,
     TEAM1_MINION_1, TEAM1_MINION_2, TEAM2_MINION_1, TEAM2_MINION_2, TEAM1_MINION_1_INSTRUCTIONS, TEAM1_MINION_2_INSTRUCTIONS, TEAM2_MINION_1_INSTRUCTIONS, TEAM2_MINION_2_INSTRUCTIONS, TEAM1_MINION_1_POWER, TEAM1_MINION_2_POWER, TEAM2_MINION_1_POWER, TEAM2_MINION_2_POWER
 )
-from src.utils.game_state import GameState
+from src.utils.game_state import GameState, BUMPED_NO_ROOM
 from src.rendering.sprites import SpriteManager
 from src.rendering.ui import DialogueBox, WebcamDisplay
 from src.rendering.board import BoardRenderer
 from src.rendering.ui_manager import UIManager
-from src.input.event_handler import EventHandler
+from src.input.event_handler import EventHandler, AI_TURN_DONE, GESTURE_DONE
 from src.ai.gesture_recognition import GestureRecognizer
-from src.entities.minion import Minion
+from src.entities.minion import Minion, TEAM1_PERSONALITY, TEAM2_PERSONALITY
 from src.entities.guide import Guide
 from src.ai.ai_service import AIService
 
+# Frames at or below this many pixels are too small to benefit from OpenCV's
+# internal thread pool; dispatch overhead outweighs the work itself.
+CV_SINGLE_THREAD_MAX_AREA = 640 * 480
+
+# cv::CPU_AVX2 and cv::CPU_NEON feature ids from OpenCV's core/cvdef.h
+_CV_CPU_AVX2 = 11
+_CV_CPU_NEON = 100
+
+def configure_opencv(frame_area=WEBCAM_WIDTH * WEBCAM_HEIGHT):
+    """Enable OpenCV's SIMD paths and size its thread pool for the frame area"""
+    cv2.setUseOptimized(True)
+    if frame_area <= CV_SINGLE_THREAD_MAX_AREA:
+        cv2.setNumThreads(1)
+    else:
+        cv2.setNumThreads(max(2, (os.cpu_count() or 1) // 4))
+
+    # Report the SIMD dispatch compiled into this OpenCV build once at startup
+    for line in cv2.getBuildInformation().splitlines():
+        line = line.strip()
+        if line.startswith("CPU/HW features") or line.startswith("Dispatched code generation"):
+            logger.info("OpenCV %s", line)
+    # The CPU_* constants are missing from some Python bindings, so fall back to OpenCV's numeric feature ids
+    try:
+        simd = (getattr(cv2, "CPU_AVX2", _CV_CPU_AVX2), getattr(cv2, "CPU_NEON", _CV_CPU_NEON))
+        if not any(cv2.checkHardwareSupport(feature) for feature in simd):
+            logger.warning("OpenCV is running without AVX2/NEON support; webcam processing will be slower")
+    except (AttributeError, cv2.error) as e:
+        logger.debug("Could not query OpenCV hardware support: %s", e)
+
+    # Let the T-API run UMat operations on an OpenCL device when there is one; otherwise stay on the CPU
+    cv2.ocl.setUseOpenCL(cv2.ocl.haveOpenCL())
+    if cv2.ocl.useOpenCL():
+        logger.info("OpenCV OpenCL device: %s", cv2.ocl.Device.getDefault().name())
+
+# Per-team formatters for the gesture display text, indexed by team_id - 1
+_GESTURE_FMT = ("Team 1 Guide: {}".format, "Team 2 Guide: {}".format)
+
+# Read-only decision used when a minion's AI task fails
+_FALLBACK_MOVE = types.MappingProxyType({
+    "move": "stay",
+    "dialogue": "Hmm, I'm a bit stuck.",
+    "thought": "An error occurred while deciding, so I'll hold still.",
+    "strategy": "Defaulting to a safe move."
+})
+
+# Grid markers in minions_status order (team 1 minion 1, team 1 minion 2, team 2 minion 1, team 2 minion 2)
+_MINION_MARKERS = np.array([TEAM1_MINION_1, TEAM1_MINION_2, TEAM2_MINION_1, TEAM2_MINION_2], dtype=np.uint8)
+
+logger = logging.getLogger(__name__)
+
 class Game:
     def __init__(self):
         # Initialize pygame
         pygame.init()
+
+        # Tune OpenCV before the webcam pipeline makes any cv2 calls
+        configure_opencv()
         
         self.ai_service = AIService()
         
@@ -45,10 +103,6 @@ class Game:
         self.thought_font = pygame.font.SysFont('Arial', 18, italic=True)
         self.btn_font = pygame.font.SysFont(None, 24)
         
-        # Calculate board position to center it (will be used by board renderer and UI manager)
-        self.BOARD_X = (SCREEN_WIDTH - (GRID_WIDTH * TILE_SIZE)) // 2
-        self.BOARD_Y = 30  # Reduced from 50 to 30 to match UI Manager
-        
         # Initialize components
         self.initialize_components()
         
@@ -60,12 +114,8 @@ class Game:
         
         # AI turn controls for simultaneous moves
         self.ai_turn_processing = False  # True when AI decisions are being processed
-        self.ai_threads_completed = 0    # Counter for completed AI tasks
-
-        # Stores move data for both minions of team 1 and team 2
-        # 1 is team 1 minion 1, 2 is team 1 minion 2, 3 is team 2 minion 1, 4 is team 2 minion 2
-        self.pending_moves = {1: None, 2: None, 3: None, 4: None}
-        self.completion_lock = threading.Lock() # For safely incrementing ai_threads_completed
+        # Bumped for every started turn and on reset; AI_TURN_DONE events for any other id are stale
+        self._ai_turn_id = 0
         
         # Dialogue and gesture displays
         self.current_gestures = {1: "No gesture", 2: "No gesture"} # Store gestures for each team
@@ -80,18 +130,29 @@ class Game:
         self.countdown_active = True
         self.countdown_start_time = pygame.time.get_ticks()
         self.countdown_duration = 5  # seconds
+        # Button label for each remaining second, built once instead of formatted every frame
+        self._countdown_labels = tuple(f"Capturing in {remaining}..." for remaining in range(self.countdown_duration + 1))
+        # Gesture analyses sent by query_openai that have not reported back yet; no new capture starts until it is 0
+        self._gesture_queries_in_flight = 0
 
         # Signal  Result
         self.team1_signal = False
         self.team2_signal = False
 
         self.is_pausing = False
+
+        # 64-bit LCG state for collision tie-breaks
+        self._rng_state = random.getrandbits(64)
         
         # Main loop control
         self.running = True
 
         self.async_loop = asyncio.new_event_loop()
-        threading.Thread(target=self.async_loop.run_forever, daemon=True).start()
+        # One persistent pool for blocking work awaited from coroutines (run_in_executor(None, ...) / to_thread)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="minion")
+        self.async_loop.set_default_executor(self._executor)
+        self._async_thread = threading.Thread(target=self.async_loop.run_forever, name="asyncio-loop", daemon=True)
+        self._async_thread.start()
         
     def initialize_components(self):
         """Initialize game components"""
@@ -100,7 +161,7 @@ class Game:
         
         # Create board renderer
         self.board_renderer = BoardRenderer(
-            self.BOARD_X, self.BOARD_Y, 
+            BOARD_X, BOARD_Y, 
             GRID_WIDTH, GRID_HEIGHT, 
             TILE_SIZE, self.sprites
         )
@@ -122,19 +183,109 @@ class Game:
     def init_webcam(self):
         """Initialize the webcam"""
         try:
-            self.webcam = cv2.VideoCapture(0)
+            self.webcam = self.open_webcam()
             if self.webcam.isOpened():
                 self.webcam_available = True
+                self.request_mjpg()
+                # Keep at most one frame queued in the driver so a captured gesture is never several frames old
+                if not self.webcam.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+                    logger.info("Webcam backend does not allow reducing its capture buffer size")
+                # Ask for frames at exactly the preview size so the game loop only has to mirror them
+                self.webcam.set(cv2.CAP_PROP_FRAME_WIDTH, WEBCAM_WIDTH)
+                self.webcam.set(cv2.CAP_PROP_FRAME_HEIGHT, WEBCAM_HEIGHT)
+                capture_size = (int(self.webcam.get(cv2.CAP_PROP_FRAME_WIDTH)), int(self.webcam.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+                if capture_size != (WEBCAM_WIDTH, WEBCAM_HEIGHT):
+                    logger.info("Webcam captures at %dx%d; frames will be resized to %dx%d", *capture_size, WEBCAM_WIDTH, WEBCAM_HEIGHT)
+                # The game loop converts at most WEBCAM_FPS frames a second, so don't have the camera send more
+                if not self.webcam.set(cv2.CAP_PROP_FPS, WEBCAM_FPS):
+                    logger.info("Webcam backend does not allow setting its frame rate")
+                # Newest frame from the grabber thread, numbered so the game loop can tell a new frame from one it already used
+                self._cam_lock = threading.Lock()
+                self._latest_frame = None
+                self._frame_id = 0
+                self._taken_frame_id = 0
+                # Earliest time.monotonic() at which the game loop converts the next frame
+                self._next_cam_time = 0.0
+                # Scratch buffer reused for every frame so the conversion never allocates
+                self._cam_bgr = np.empty((WEBCAM_HEIGHT, WEBCAM_WIDTH, 3), dtype=np.uint8)
+                # Device-side resize and flip targets for the OpenCL path, likewise allocated once
+                if cv2.ocl.useOpenCL():
+                    self._cam_resized_umat = cv2.UMat(WEBCAM_HEIGHT, WEBCAM_WIDTH, cv2.CV_8UC3)
+                    self._cam_mirrored_umat = cv2.UMat(WEBCAM_HEIGHT, WEBCAM_WIDTH, cv2.CV_8UC3)
+                # One surface for the whole run that reads OpenCV's BGR order directly; writing the buffer updates it
+                self._cam_surface = pygame.image.frombuffer(self._cam_bgr, (WEBCAM_WIDTH, WEBCAM_HEIGHT), "BGR")
+                # Display-format copy that is actually drawn, so the 60 fps blits skip the 24-bit BGR conversion
+                self._cam_display = self._cam_surface.convert()
+                # Set by shutdown() to end the grabber before the camera is released
+                self._cam_stop = threading.Event()
+                self._cam_thread = threading.Thread(target=self.grab_frames, name="webcam-grabber", daemon=True)
+                self._cam_thread.start()
             else:
-                print("Warning: Webcam could not be opened. Retrying...")
-                # Try a different approach
-                self.webcam = cv2.VideoCapture(0, cv2.CAP_AVFOUNDATION)  # Specifically for macOS
-                if self.webcam.isOpened():
-                    self.webcam_available = True
-                else:
-                    print("Error: Could not access webcam. Running without camera.")
+                logger.error("Could not access webcam. Running without camera.")
         except Exception as e:
-            print(f"Error initializing webcam: {e}")
+            logger.error("Error initializing webcam: %s", e)
+
+    def open_webcam(self):
+        """Open camera 0 on the platform's native backend, without probing the others"""
+        # An explicit backend skips OpenCV's probe loop and lets us request MJPG from the driver;
+        # if it can't open the camera, the default-backend probe would not find one either
+        if sys.platform.startswith("linux"):
+            backend = cv2.CAP_V4L2
+        elif sys.platform == "win32":
+            backend = cv2.CAP_DSHOW
+        else:
+            backend = cv2.CAP_AVFOUNDATION  # Specifically for macOS
+        return cv2.VideoCapture(0, backend)
+
+    def request_mjpg(self):
+        """Ask the camera for MJPG frames, which decode cheaper than raw YUYV"""
+        mjpg = cv2.VideoWriter_fourcc(*'MJPG')
+        self.webcam.set(cv2.CAP_PROP_FOURCC, mjpg)
+        # Cameras without MJPG support keep their default format
+        if int(self.webcam.get(cv2.CAP_PROP_FOURCC)) != mjpg:
+            logger.info("Webcam does not support MJPG, using its default pixel format")
+
+    def grab_frames(self):
+        """Read the webcam continuously on its own thread so the game loop never waits on it"""
+        try:
+            while not self._cam_stop.is_set():
+                # grab() just advances the stream; decoding is left to retrieve()
+                if not self.webcam.grab():
+                    # Back off briefly so a disconnected camera doesn't spin this thread; wakes early on shutdown
+                    self._cam_stop.wait(0.05)
+                    continue
+                # Only decode when the game loop has taken the previous frame; otherwise this one is skipped
+                with self._cam_lock:
+                    wanted = self._taken_frame_id == self._frame_id
+                if not wanted:
+                    continue
+                ok, frame = self.webcam.retrieve()
+                if ok:
+                    with self._cam_lock:
+                        self._latest_frame = frame
+                        self._frame_id += 1
+        finally:
+            # Only this thread ever calls grab(), so releasing here can't race a read in progress
+            self.webcam.release()
+        
+    def shutdown(self):
+        """Stop the webcam grabber, release the camera and stop the AI worker threads before exit"""
+        if hasattr(self, '_cam_thread'):
+            self._cam_stop.set()
+            # grab() blocks for at most one frame interval, so this returns quickly.
+            # The grabber releases the camera itself on its way out.
+            self._cam_thread.join(timeout=1.0)
+            self.webcam_available = False
+            if self._cam_thread.is_alive():
+                logger.warning("Webcam grabber is still inside grab(); it will release the camera when it returns")
+        elif self.webcam is not None:
+            self.webcam.release()
+        
+        # Stop the asyncio loop, then the pool it hands blocking work to; in-flight requests are abandoned
+        if hasattr(self, '_async_thread'):
+            self.async_loop.call_soon_threadsafe(self.async_loop.stop)
+            self._async_thread.join(timeout=1.0)
+            self._executor.shutdown(wait=False, cancel_futures=True)
         
     def initialize_game_objects(self):
         """Initialize game objects based on game state"""
@@ -142,31 +293,15 @@ class Game:
         self.team1_guide = Guide(1, self.game_state.team1_targets)
         self.team2_guide = Guide(2, self.game_state.team2_targets)
         
-        # Personality for team 1 minion
-        team1_personality = {
-            "propensity_to_listen": 0.8,
-            "intelligence": 4,
-            "speed": 3,
-            "power": 3,
-            "style": "bubbly"
-        }
-        
-        # Personality for team 2 minion
-        team2_personality = {
-            "propensity_to_listen": 0.7,
-            "intelligence": 3,
-            "speed": 4,
-            "power": 2,
-            "style": "hectic"
-        }
-        
-        self.team1_minion_1 = Minion(1, self.game_state.team1_minion_1_pos, TEAM1_MINION_1_POWER, "Team 1 Minion 1", team1_personality, TEAM1_MINION_1_INSTRUCTIONS)
-        self.team1_minion_2 = Minion(1, self.game_state.team1_minion_2_pos, TEAM1_MINION_2_POWER, "Team 1 Minion 2", team1_personality, TEAM1_MINION_2_INSTRUCTIONS)
-        self.team2_minion_1 = Minion(2, self.game_state.team2_minion_1_pos, TEAM2_MINION_1_POWER, "Team 2 Minion 1", team2_personality, TEAM2_MINION_1_INSTRUCTIONS)
-        self.team2_minion_2 = Minion(2, self.game_state.team2_minion_2_pos, TEAM2_MINION_2_POWER, "Team 2 Minion 2", team2_personality, TEAM2_MINION_2_INSTRUCTIONS)
+        self.team1_minion_1 = Minion(1, self.game_state.team1_minion_1_pos, TEAM1_MINION_1_POWER, "Team 1 Minion 1", TEAM1_PERSONALITY, TEAM1_MINION_1_INSTRUCTIONS)
+        self.team1_minion_2 = Minion(1, self.game_state.team1_minion_2_pos, TEAM1_MINION_2_POWER, "Team 1 Minion 2", TEAM1_PERSONALITY, TEAM1_MINION_2_INSTRUCTIONS)
+        self.team2_minion_1 = Minion(2, self.game_state.team2_minion_1_pos, TEAM2_MINION_1_POWER, "Team 2 Minion 1", TEAM2_PERSONALITY, TEAM2_MINION_1_INSTRUCTIONS)
+        self.team2_minion_2 = Minion(2, self.game_state.team2_minion_2_pos, TEAM2_MINION_2_POWER, "Team 2 Minion 2", TEAM2_PERSONALITY, TEAM2_MINION_2_INSTRUCTIONS)
                 
         # Add this line to initialize the new attribute for the live frame
         self.live_pygame_frame_surface = None
+        # Set when update() converted a new webcam frame that the window has not shown yet
+        self._cam_frame_dirty = False
         
     def reset_game_objects(self):
         """Reset game objects after game state reset"""
@@ -198,58 +333,67 @@ class Game:
         # Reset UI Manager's step counting and tracking
         self.ui_manager.reset_tracking()
         
-        # Reset AI turn controls
+        # Reset AI turn controls; a turn still in flight reports back under an old id and is dropped
         self.ai_turn_processing = False
-        self.ai_threads_completed = 0
-        self.pending_moves = {1: None, 2: None, 3: None, 4: None}
+        self._ai_turn_id += 1
         
     def run(self):
         """Main game loop"""
-        while self.running:
-            self.event_handler.process_events()
-            self.update()
-            self.draw()
-            
-            # Cap the frame rate
-            self.clock.tick(60)
+        try:
+            while self.running:
+                self.event_handler.process_events()
+                self.update()
+                self.draw()
+                
+                # Cap the frame rate
+                self.clock.tick(60)
+        finally:
+            # Runs on quit (SystemExit), Ctrl+C and crashes alike
+            self.shutdown()
             
     def update(self):
         """Update game state"""
+        # Bound once; the UI manager is touched several times per frame
+        ui = self.ui_manager
         # Update dialogue display (if it's a general display)
-        self.ui_manager.dialogue_box.update()
-        
-        # Check if both AI tasks have finished
-        if self.ai_turn_processing and self.ai_threads_completed == 4:
-            print("AI turn completed")
-            self.process_simultaneous_moves(self.pending_moves[1], self.pending_moves[2], self.pending_moves[3], self.pending_moves[4])
-            # Reset flags for the next turn
-            self.ai_turn_processing = False
-            self.ai_threads_completed = 0
-            self.pending_moves = {1: None, 2: None, 3: None, 4: None}
-            self.countdown_active = True
-        
-        # Update webcam frame
+        ui.dialogue_box.update()
+        
+        # Update webcam frame, at most WEBCAM_FPS times a second; other ticks reuse the previous surface
         if self.webcam_available:
-            ok, frame = self.webcam.read()
-            if ok:
-                frame = cv2.resize(frame, (WEBCAM_WIDTH, WEBCAM_HEIGHT))
-                frame = cv2.flip(frame, 1) # Horizontally flip the frame
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                frame = np.rot90(frame)
-                frame_surface = pygame.surfarray.make_surface(np.flipud(frame))
-                # Store the pygame surface for drawing
-                self.live_pygame_frame_surface = frame_surface
-                # Save raw CV2 frame for API (GestureRecognizer expects this format)
-                self.ui_manager.webcam_display.last_frame = frame
-            else:
-                # Indicate no current frame available for drawing
-                self.live_pygame_frame_surface = None
+            now = time.monotonic()
+            if now >= self._next_cam_time:
+                self._next_cam_time = now + 1 / WEBCAM_FPS
+                # Take the newest frame from the grabber thread without waiting on the camera;
+                # an unchanged frame id means there is nothing new to convert
+                with self._cam_lock:
+                    frame = None
+                    if self._frame_id != self._taken_frame_id:
+                        frame = self._latest_frame
+                        self._taken_frame_id = self._frame_id
+                if frame is not None:
+                    if frame.shape[1] == WEBCAM_WIDTH and frame.shape[0] == WEBCAM_HEIGHT:
+                        # The camera already delivers the preview size; mirroring is the only pass left
+                        cv2.flip(frame, 1, dst=self._cam_bgr)
+                    elif cv2.ocl.useOpenCL():
+                        # Resize and flip on the OpenCL device; only the small result is downloaded
+                        cv2.resize(cv2.UMat(frame), (WEBCAM_WIDTH, WEBCAM_HEIGHT), dst=self._cam_resized_umat)
+                        cv2.flip(self._cam_resized_umat, 1, dst=self._cam_mirrored_umat)
+                        np.copyto(self._cam_bgr, self._cam_mirrored_umat.get())
+                    else:
+                        cv2.resize(frame, (WEBCAM_WIDTH, WEBCAM_HEIGHT), dst=self._cam_bgr)
+                        cv2.flip(self._cam_bgr, 1, dst=self._cam_bgr) # Horizontally flip the frame
+                    # Convert into the display-format surface once per new frame rather than on every draw.
+                    # query_openai reads the BGR buffer on demand, so nothing else is stashed per frame.
+                    self._cam_display.blit(self._cam_surface, (0, 0))
+                    self.live_pygame_frame_surface = self._cam_display
+                    self._cam_frame_dirty = True
+            # Without a new frame the previous one stays on screen
         else:
             # Indicate no current frame available for drawing
             self.live_pygame_frame_surface = None
             
         # Update UI manager
-        self.ui_manager.update(
+        ui.update(
             self.game_state, 
             "", # General dialogue/thought can be managed via team-specific attributes now
             "", 
@@ -269,20 +413,43 @@ class Game:
 
         # Countdown
         if self.countdown_active and not self.is_pausing:
-            elapsed = (pygame.time.get_ticks() - self.countdown_start_time) // 1000
-            remaining = max(0, self.countdown_duration - elapsed)
-
-            # Update button label to show countdown
-            self.ui_manager.ai_button.text = f"Capturing in {remaining}..."
-
-            if remaining == 0 :
-                self.query_openai(self.ui_manager.webcam_display.last_frame.copy())
+            if not self.webcam_available:
+                # Nothing to capture without a camera: hold the countdown and leave turns to Space / the AI button
+                ui.ai_button.set_text("No Camera - Press Space")
                 self.countdown_start_time = pygame.time.get_ticks()
-                self.countdown_active = False
+            else:
+                elapsed = (pygame.time.get_ticks() - self.countdown_start_time) // 1000
+                remaining = max(0, self.countdown_duration - elapsed)
+
+                # Update button label to show countdown
+                ui.ai_button.set_text(self._countdown_labels[remaining])
+
+                if remaining == 0 :
+                    self.countdown_start_time = pygame.time.get_ticks()
+                    if self.live_pygame_frame_surface is None:
+                        # No camera frame yet; keep counting down and try again
+                        logger.warning("No webcam frame available to capture, retrying")
+                    elif self._gesture_queries_in_flight:
+                        # The previous capture is still being analysed; don't send a duplicate request
+                        logger.info("Previous gesture analysis still running, waiting before the next capture")
+                    else:
+                        # The BGR buffer behind the live surface is only read here, when a gesture is captured
+                        self.query_openai(self._cam_bgr)
+                        self.countdown_active = False
         else:
             self.countdown_start_time = pygame.time.get_ticks()
     def draw(self):
         """Render the game"""
+        # When nothing but the webcam feed changed, repaint and present just the feed's rect.
+        # The game over overlay covers the feed, so that screen always takes the full path.
+        redraw = self.ui_manager.needs_redraw(self.game_state, self.live_pygame_frame_surface, self.ai_turn_processing)
+        if not redraw and not (self._cam_frame_dirty and self.game_state.game_over):
+            if self._cam_frame_dirty:
+                self.ui_manager.draw_camera_feed(self.screen, self.live_pygame_frame_surface, self.webcam_available)
+                pygame.display.update(self.ui_manager.webcam_display.rect)
+                self._cam_frame_dirty = False
+            return
+        
         # Draw UI components (background, panels, buttons, webcam)
         self.ui_manager.draw(
             self.screen, 
@@ -308,13 +475,19 @@ class Game:
         
         # Update the display
         pygame.display.flip()
+        self._cam_frame_dirty = False
+
+    def next_random_bits(self):
+        """Advance the LCG and return its top 31 bits (the low bits of an LCG are weak)"""
+        self._rng_state = (self._rng_state * 6364136223846793005 + 1442695040888963407) & 0xFFFFFFFFFFFFFFFF
+        return self._rng_state >> 33
 
     def state_toggle(self):
         self.is_pausing = not self.is_pausing
         if self.is_pausing :
-            self.ui_manager.webcam_button.text = "Resume"
+            self.ui_manager.webcam_button.set_text("Resume")
         else:
-            self.ui_manager.webcam_button.text = "Pause"
+            self.ui_manager.webcam_button.set_text("Pause")
     
     def start_both_ai_turns(self):
         """Start the AI thinking process for both teams simultaneously."""
@@ -322,89 +495,68 @@ class Game:
             return # Prevent starting new AI turns if game over or already processing
             
         self.ai_turn_processing = True
-        self.ai_threads_completed = 0
-        self.pending_moves = {1: None, 2: None, 3: None, 4: None}
+        self._ai_turn_id += 1
+        turn_id = self._ai_turn_id
         self.team1_signal = False
         self.team2_signal = False
 
-        current_grid_snapshot = [row[:] for row in self.game_state.grid]
-
-        
-        collected_items_team1_snapshot = list(self.game_state.team1_collected)
-        target_items_team1_snapshot = list(self.game_state.team1_targets) if self.game_state.team1_targets else None
+        # Freeze the grid once as nested tuples of plain ints; all four read-only AI tasks share it
+        grid_snapshot = tuple(map(tuple, self.game_state.grid.tolist()))
+        
+        # Collected/target items are immutable tuples that are only replaced on the main thread,
+        # so the AI tasks can share them directly without a snapshot copy
+        collected_items_team1 = self.game_state.team1_collected
+        target_items_team1 = self.game_state.team1_targets
+
+        collected_items_team2 = self.game_state.team2_collected
+        target_items_team2 = self.game_state.team2_targets
+        
+        async def run_turn():
+            # One cross-thread hop for the whole turn; a failing minion doesn't cancel the others
+            return await asyncio.gather(
+                self.team1_minion_1.decide_move(grid_snapshot, self.ai_service, collected_items_team1, target_items_team1),
+                self.team1_minion_2.decide_move(grid_snapshot, self.ai_service, collected_items_team1, target_items_team1),
+                self.team2_minion_1.decide_move(grid_snapshot, self.ai_service, collected_items_team2, target_items_team2),
+                self.team2_minion_2.decide_move(grid_snapshot, self.ai_service, collected_items_team2, target_items_team2),
+                return_exceptions=True
+            )
 
-        
-        collected_items_team2_snapshot = list(self.game_state.team2_collected)
-        target_items_team2_snapshot = list(self.game_state.team2_targets) if self.game_state.team2_targets else None
-        
-        # Callback for when an AI task completes
-        def _ai_task_callback(future, minion_id):
-            move_result = None
+        # Callback for when the whole turn completes (runs on the asyncio thread)
+        def _ai_turn_callback(future):
             try:
-                move_result = future.result()
-            except Exception as e:
-                print(f"Error in AI task for minion {minion_id}: {e}") # Proper logging recommended
-                move_result = {
-                    "move": "stay",
-                    "dialogue": "Hmm, I'm a bit stuck.",
-                    "thought": f"An error occurred: {str(e)[:50]}...",
-                    "strategy": "Defaulting to a safe move."
-                }
-            finally:
-                self.pending_moves[minion_id] = move_result
-                with self.completion_lock:
-                    self.ai_threads_completed += 1
-
-        # Schedule coroutines on the existing event loop for each team's minion
-        # Pass copies of mutable arguments (snapshots) to ensure thread safety if they were modified by minion internally
-        # (though decide_move should ideally not modify its input snapshots)
-        future1 = asyncio.run_coroutine_threadsafe(
-            self.team1_minion_1.decide_move(
-                [row[:] for row in current_grid_snapshot], # Fresh copy of grid snapshot
-                self.ai_service,
-                list(collected_items_team1_snapshot) if collected_items_team1_snapshot else None,
-                list(target_items_team1_snapshot) if target_items_team1_snapshot else None
-            ),
-            self.async_loop
-        )
-        future1.add_done_callback(lambda f: _ai_task_callback(f, 1))
-
-        future2 = asyncio.run_coroutine_threadsafe(
-            self.team1_minion_2.decide_move(
-                [row[:] for row in current_grid_snapshot], # Fresh copy of grid snapshot
-                self.ai_service,
-                list(collected_items_team1_snapshot) if collected_items_team1_snapshot else None,
-                list(target_items_team1_snapshot) if target_items_team1_snapshot else None
-            ),
-            self.async_loop
-        )
-        future2.add_done_callback(lambda f: _ai_task_callback(f, 2))
-
-        future3 = asyncio.run_coroutine_threadsafe(
-            self.team2_minion_1.decide_move(
-                [row[:] for row in current_grid_snapshot], # Fresh copy of grid snapshot
-                self.ai_service,
-                list(collected_items_team2_snapshot) if collected_items_team2_snapshot else None,
-                list(target_items_team2_snapshot) if target_items_team2_snapshot else None
-            ),
-            self.async_loop
-        )
-        future3.add_done_callback(lambda f: _ai_task_callback(f, 3))
-
-        future4 = asyncio.run_coroutine_threadsafe(
-            self.team2_minion_2.decide_move(
-                [row[:] for row in current_grid_snapshot], # Fresh copy of grid snapshot
-                self.ai_service,
-                list(collected_items_team2_snapshot) if collected_items_team2_snapshot else None,
-                list(target_items_team2_snapshot) if target_items_team2_snapshot else None
-            ),
-            self.async_loop
-        )
-        future4.add_done_callback(lambda f: _ai_task_callback(f, 4))
+                results = future.result()
+            except (Exception, concurrent.futures.CancelledError) as e:
+                # CancelledError is a BaseException; the turn must still report back or it never ends
+                results = [e] * 4
+            moves = []
+            for minion_id, result in enumerate(results, start=1):
+                if isinstance(result, BaseException):
+                    logger.error("Error in AI task for minion %s: %s", minion_id, result)
+                    result = _FALLBACK_MOVE
+                moves.append(result)
+            # pygame's event queue is thread-safe; the main loop picks this up in EventHandler
+            pygame.event.post(pygame.event.Event(AI_TURN_DONE, turn_id=turn_id, results=moves))
+
+        # Schedule the turn on the existing event loop
+        # decide_move only reads its inputs, so every task gets the same immutable snapshot
+        future = asyncio.run_coroutine_threadsafe(run_turn(), self.async_loop)
+        future.add_done_callback(_ai_turn_callback)
+
+    def finish_ai_turn(self, turn_id, results):
+        """Apply the four AI decisions once the whole turn has come back"""
+        # Results from a turn started before a reset (or any turn but the current one) are discarded
+        if not self.ai_turn_processing or turn_id != self._ai_turn_id:
+            logger.info("Discarding results of stale AI turn %s", turn_id)
+            return
+        logger.info("AI turn completed")
+        self.process_simultaneous_moves(*results)
+        # Reset flags for the next turn
+        self.ai_turn_processing = False
+        self.countdown_active = True
 
     def send_gesture(self, team_id, gesture):
         """Send a gesture from the guide to the minion and store it."""
-        self.current_gestures[team_id] = f"Team {team_id} Guide: {gesture}"
+        self.current_gestures[team_id] = _GESTURE_FMT[team_id - 1](gesture)
         
         if team_id == 1:
             self.team1_minion_1.receive_gesture(gesture)
@@ -415,138 +567,108 @@ class Game:
                 
     def process_simultaneous_moves(self, decision_team1_1, decision_team1_2, decision_team2_1, decision_team2_2):
         """Process moves for all teams, handle collisions based on power, and update game state."""
-        if self.game_state.game_over:
+        # Bind hot attributes to locals once; they are used throughout the turn
+        game_state = self.game_state
+        minion_text = self.ui_manager.minion_text
+        calculate_new_position = game_state.calculate_new_position
+        if game_state.game_over:
             return
 
-        # Extract decisions
-        move_action_team1_1 = decision_team1_1.get("move", "stay")
-        dialogue_team1_1 = decision_team1_1.get("dialogue", "...")
-        thought_team1_1 = decision_team1_1.get("thought", "...")
-
-        move_action_team1_2 = decision_team1_2.get("move", "stay")
-        dialogue_team1_2 = decision_team1_2.get("dialogue", "...")
-        thought_team1_2 = decision_team1_2.get("thought", "...")
-
-        move_action_team2_1 = decision_team2_1.get("move", "stay")
-        dialogue_team2_1 = decision_team2_1.get("dialogue", "...")
-        thought_team2_1 = decision_team2_1.get("thought", "...")
-        
-        move_action_team2_2 = decision_team2_2.get("move", "stay")
-        dialogue_team2_2 = decision_team2_2.get("dialogue", "...")
-        thought_team2_2 = decision_team2_2.get("thought", "...")
-
-        # Store original current positions (copies)
-        orig_pos_t1m1 = self.game_state.team1_minion_1_pos[:]
-        orig_pos_t1m2 = self.game_state.team1_minion_2_pos[:]
-        orig_pos_t2m1 = self.game_state.team2_minion_1_pos[:]
-        orig_pos_t2m2 = self.game_state.team2_minion_2_pos[:]
-
-        # Calculate tentative new positions
-        new_pos_team1_1 = self.game_state.calculate_new_position(orig_pos_t1m1[:], move_action_team1_1)
-        new_pos_team1_2 = self.game_state.calculate_new_position(orig_pos_t1m2[:], move_action_team1_2)
-        new_pos_team2_1 = self.game_state.calculate_new_position(orig_pos_t2m1[:], move_action_team2_1)
-        new_pos_team2_2 = self.game_state.calculate_new_position(orig_pos_t2m2[:], move_action_team2_2)
-
-        minions_status = [
-            {"id": 1, "minion_obj": self.team1_minion_1, "intended_pos": new_pos_team1_1[:], "spawn_pos": self.game_state.TEAM1_1_SPAWN_POS[:], "final_pos": new_pos_team1_1[:], "marker": TEAM1_MINION_1, "gs_pos_attr": "team1_minion_1_pos", "collected_list": self.game_state.team1_collected, "guide_obj": self.team1_guide, "last_move_attr": "team1_1_last_move", "move_action": move_action_team1_1, "dialogue": dialogue_team1_1, "thought": thought_team1_1, "ui_dialogue_attr": "team1_minion_1_dialogue", "ui_thought_attr": "team1_minion_1_thought"},
-            {"id": 2, "minion_obj": self.team1_minion_2, "intended_pos": new_pos_team1_2[:], "spawn_pos": self.game_state.TEAM1_2_SPAWN_POS[:], "final_pos": new_pos_team1_2[:], "marker": TEAM1_MINION_2, "gs_pos_attr": "team1_minion_2_pos", "collected_list": self.game_state.team1_collected, "guide_obj": self.team1_guide, "last_move_attr": "team1_2_last_move", "move_action": move_action_team1_2, "dialogue": dialogue_team1_2, "thought": thought_team1_2, "ui_dialogue_attr": "team1_minion_2_dialogue", "ui_thought_attr": "team1_minion_2_thought"},
-            {"id": 3, "minion_obj": self.team2_minion_1, "intended_pos": new_pos_team2_1[:], "spawn_pos": self.game_state.TEAM2_1_SPAWN_POS[:], "final_pos": new_pos_team2_1[:], "marker": TEAM2_MINION_1, "gs_pos_attr": "team2_minion_1_pos", "collected_list": self.game_state.team2_collected, "guide_obj": self.team2_guide, "last_move_attr": "team2_1_last_move", "move_action": move_action_team2_1, "dialogue": dialogue_team2_1, "thought": thought_team2_1, "ui_dialogue_attr": "team2_minion_1_dialogue", "ui_thought_attr": "team2_minion_1_thought"},
-            {"id": 4, "minion_obj": self.team2_minion_2, "intended_pos": new_pos_team2_2[:], "spawn_pos": self.game_state.TEAM2_2_SPAWN_POS[:], "final_pos": new_pos_team2_2[:], "marker": TEAM2_MINION_2, "gs_pos_attr": "team2_minion_2_pos", "collected_list": self.game_state.team2_collected, "guide_obj": self.team2_guide, "last_move_attr": "team2_2_last_move", "move_action": move_action_team2_2, "dialogue": dialogue_team2_2, "thought": thought_team2_2, "ui_dialogue_attr": "team2_minion_2_dialogue", "ui_thought_attr": "team2_minion_2_thought"},
-        ]
+        grid = game_state.grid
+
+        # One row per minion, in pending-move order:
+        # (id, minion, game_state position attr, spawn position, grid marker, team, last-move attr)
+        minion_rows = (
+            (1, self.team1_minion_1, "team1_minion_1_pos", game_state.TEAM1_1_SPAWN_POS, TEAM1_MINION_1, 1, "team1_1_last_move"),
+            (2, self.team1_minion_2, "team1_minion_2_pos", game_state.TEAM1_2_SPAWN_POS, TEAM1_MINION_2, 1, "team1_2_last_move"),
+            (3, self.team2_minion_1, "team2_minion_1_pos", game_state.TEAM2_1_SPAWN_POS, TEAM2_MINION_1, 2, "team2_1_last_move"),
+            (4, self.team2_minion_2, "team2_minion_2_pos", game_state.TEAM2_2_SPAWN_POS, TEAM2_MINION_2, 2, "team2_2_last_move"),
+        )
+        decisions = (decision_team1_1, decision_team1_2, decision_team2_1, decision_team2_2)
+
+        # Extract decisions and calculate tentative new positions in a single pass
+        minions_status = []
+        for (minion_id, minion, gs_pos_attr, spawn_pos, marker, team_id, last_move_attr), decision in zip(minion_rows, decisions):
+            move_action = decision.get("move", "stay")
+            # Translate the AI's move string once; unknown moves behave like "stay"
+            move_code = MOVE_CODES.get(move_action, MOVE_STAY)
+            # Store a copy of the original position; calculate_new_position returns a new array
+            orig_pos = getattr(game_state, gs_pos_attr).copy()
+            new_pos = calculate_new_position(orig_pos, move_code)
+            minions_status.append({
+                "id": minion_id, "minion_obj": minion, "orig_pos": orig_pos, "intended_pos": new_pos, "spawn_pos": spawn_pos,
+                "final_pos": new_pos.copy(), "marker": marker, "gs_pos_attr": gs_pos_attr, "team_id": team_id,
+                "last_move_attr": last_move_attr, "move_action": move_action,
+                "dialogue": decision.get("dialogue", "..."), "thought": decision.get("thought", "..."),
+            })
 
         for data in minions_status:
             setattr(self, data["last_move_attr"], data["move_action"])
-            current_dialogue = getattr(self.ui_manager, data["ui_dialogue_attr"], "")
-            setattr(self.ui_manager, data["ui_dialogue_attr"], current_dialogue + data["dialogue"]) # Append new dialogue
-            current_thought = getattr(self.ui_manager, data["ui_thought_attr"], "")
-            setattr(self.ui_manager, data["ui_thought_attr"], current_thought + data["thought"]) # Append new thought
-
-        positions_map = {}
-        for i, data in enumerate(minions_status):
-            pos_tuple = tuple(data["intended_pos"])
-            if pos_tuple not in positions_map:
-                positions_map[pos_tuple] = []
-            positions_map[pos_tuple].append(i)
-
-        bumped_minion_indices = set()
-        for pos_tuple, m_indices in positions_map.items():
-            if len(m_indices) > 1:
-                colliding_minions_data_indexed = [(idx, minions_status[idx]) for idx in m_indices]
-                random.shuffle(colliding_minions_data_indexed)
-                colliding_minions_data_indexed.sort(key=lambda item: item[1]["minion_obj"].power, reverse=True)
-                
-                for i in range(1, len(colliding_minions_data_indexed)):
-                    loser_idx, loser_data = colliding_minions_data_indexed[i]
-                    bumped_minion_indices.add(loser_idx)
-                    collided_at_info = f" (Collided at {list(pos_tuple)})"
-                    current_dialogue = getattr(self.ui_manager, loser_data["ui_dialogue_attr"], "")
-                    setattr(self.ui_manager, loser_data["ui_dialogue_attr"], current_dialogue + f"{collided_at_info} Lost contest, bumped!")
-
-        resolved_final_positions_for_others = []
-        for i, data in enumerate(minions_status):
-            if i not in bumped_minion_indices:
-                resolved_final_positions_for_others.append(data["final_pos"][:])
-        
-        sorted_bumped_indices = sorted(list(bumped_minion_indices), key=lambda idx: minions_status[idx]["id"])
-
-        for loser_idx in sorted_bumped_indices:
-            loser_data = minions_status[loser_idx]
-            grid_snapshot_for_bump = self.game_state.grid # Pass current grid state
-            
-            new_fallback_pos = self.game_state.find_available_spawn_or_adjacent(
-                loser_data["spawn_pos"],
-                grid_snapshot_for_bump, 
-                resolved_final_positions_for_others 
-            )
-            loser_data["final_pos"] = new_fallback_pos[:]
-            resolved_final_positions_for_others.append(new_fallback_pos[:]) # Add to list for subsequent bumped minions
-
-        original_minion_positions_markers = [
-            (orig_pos_t1m1, TEAM1_MINION_1), (orig_pos_t1m2, TEAM1_MINION_2),
-            (orig_pos_t2m1, TEAM2_MINION_1), (orig_pos_t2m2, TEAM2_MINION_2),
-        ]
-        for pos, marker_val in original_minion_positions_markers:
-            if 0 <= pos[0] < GRID_HEIGHT and 0 <= pos[1] < GRID_WIDTH:
-                if self.game_state.grid[pos[0]][pos[1]] == marker_val:
-                    self.game_state.grid[pos[0]][pos[1]] = EMPTY
+            entry = minion_text[data["id"]]
+            entry["dialogue"] += data["dialogue"] # Append new dialogue
+            entry["thought"] += data["thought"] # Append new thought
+
+        # Collision resolution runs as one compiled kernel over the stacked per-minion arrays
+        intended = np.array([data["intended_pos"] for data in minions_status])
+        powers = np.array([data["minion_obj"].power for data in minions_status], dtype=np.int32)
+        # Random tie-break for equal power, drawn per minion instead of shuffling
+        tiebreak = np.array([self.next_random_bits() for _ in minions_status], dtype=np.int64)
+        spawns = np.array([data["spawn_pos"] for data in minions_status])
+        final, outcome = game_state.resolve_collisions(intended, powers, tiebreak, spawns)
+
+        for i in np.flatnonzero(outcome).tolist():
+            loser_data = minions_status[i]
+            loser_data["final_pos"] = final[i].copy()
+            collided_at_info = f" (Collided at {intended[i].tolist()})"
+            minion_text[loser_data["id"]]["dialogue"] += f"{collided_at_info} Lost contest, bumped!"
+            if outcome[i] == BUMPED_NO_ROOM:
+                logger.warning("Minion bumped to %s, which was occupied by another winner, and no suitable adjacent empty cell found", final[i].tolist())
+
+        # Clear the old minion cells in one indexed store, only where the cell still holds that minion's marker
+        old = np.array([data["orig_pos"] for data in minions_status])
+        on_grid = game_state.in_bounds(old)
+        old, old_markers = old[on_grid], _MINION_MARKERS[on_grid]
+        still_there = grid[old[:, 0], old[:, 1]] == old_markers
+        grid[old[still_there, 0], old[still_there, 1]] = EMPTY
         
         for data in minions_status:
             final_pos = data["final_pos"]
-            self.game_state.check_item_collection(final_pos, data["collected_list"])
-            setattr(self.game_state, data["gs_pos_attr"], final_pos[:])
-            data["minion_obj"].grid_pos = final_pos[:]
-            if 0 <= final_pos[0] < GRID_HEIGHT and 0 <= final_pos[1] < GRID_WIDTH:
-                self.game_state.grid[final_pos[0]][final_pos[1]] = data["marker"]
+            game_state.check_item_collection(final_pos, data["team_id"])
+            setattr(game_state, data["gs_pos_attr"], final_pos.copy())
+            data["minion_obj"].grid_pos = final_pos.copy()
 
-        self.team1_guide.update_collected(self.game_state.team1_collected)
-        self.team2_guide.update_collected(self.game_state.team2_collected)
+        # Final positions are distinct after collision resolution, so all markers can be written at once
+        new = np.array([data["final_pos"] for data in minions_status])
+        on_grid = game_state.in_bounds(new)
+        grid[new[on_grid, 0], new[on_grid, 1]] = _MINION_MARKERS[on_grid]
 
-        self.game_state.check_win_conditions()
-        if not self.game_state.game_over:
-             self.game_state.next_turn()
+        self.team1_guide.update_collected(game_state.team1_collected)
+        self.team2_guide.update_collected(game_state.team2_collected)
 
-    def query_openai(self, frame_rgb):
+        game_state.check_win_conditions()
+        if not game_state.game_over:
+             game_state.next_turn()
+
+    def query_openai(self, frame_bgr):
         """Send the captured frame to the gesture recognizer and process the result"""
         # Create a preview of the captured frame
         webcam_display = self.ui_manager.get_webcam_display()
         
-        # The frame_rgb received here is already rotated (original width becomes height, original height becomes width).
-        # To split the *original* view vertically (left/right halves), we need to split the *rotated* frame horizontally (top/bottom halves).
-        
-        processed_frame_for_api = frame_rgb.copy() 
-        original_width_as_rotated_height, _original_height_as_rotated_width, _channels = processed_frame_for_api.shape
+        # frame_bgr is the mirrored (H, W, 3) frame as shown on screen: team 1 stands on the left half, team 2 on the right.
+        # No copy here: capture_frame copies only the half it keeps for the API.
+        _height, width, _channels = frame_bgr.shape
     
         # Pass the correctly cropped frame to the gesture recognizer
-        preview_surface_team1 = self.gesture_recognizer.capture_frame(1, processed_frame_for_api[original_width_as_rotated_height // 2:, :, :])
-        preview_surface_team2 = self.gesture_recognizer.capture_frame(2, processed_frame_for_api[:original_width_as_rotated_height // 2, :, :])
+        preview_surface_team1 = self.gesture_recognizer.capture_frame(1, frame_bgr[:, :width // 2])
+        preview_surface_team2 = self.gesture_recognizer.capture_frame(2, frame_bgr[:, width // 2:])
         
         if preview_surface_team1 is None:
-            print("Error: Could not create preview surface for AI query in Game.query_openai.")
+            logger.error("Could not create preview surface for AI query in Game.query_openai.")
             webcam_display.set_captured_preview_team1(None)
             return
         
         if preview_surface_team2 is None:
-            print("Error: Could not create preview surface for AI query in Game.query_openai.")
+            logger.error("Could not create preview surface for AI query in Game.query_openai.")
             webcam_display.set_captured_preview_team2(None)
             return
         
@@ -560,52 +682,66 @@ class Game:
         future_team2 = asyncio.run_coroutine_threadsafe(
             self.gesture_recognizer.analyze_gesture(2), self.async_loop)
 
-        # Handle the result asynchronously
-        def process_analysis_result(future, team_id):
+        # Runs on the asyncio thread: hand the result to the main loop instead of touching game/UI state here
+        def post_analysis_result(future, team_id):
             try:
                 result = future.result()
-                facial_expression = result.get("facial_expressions", "Unknown")
-                gesture = result.get("gestures", "Unknown")
-                
-                # Print the complete analysis
-                print(f"Analysis result: Facial expression: {facial_expression}, Gesture: {gesture}")
-                
-                # Get current team's guide
-                current_guide = self.team1_guide if team_id == 1 else self.team2_guide
-                
-                # Send the analysis results to both the current minion and guide
-                if team_id == 1:
-                    self.team1_minion_1.receive_analysis_results(facial_expression, gesture)
-                    self.team1_minion_2.receive_analysis_results(facial_expression, gesture)
-                    self.team1_signal = True
-                elif team_id == 2:
-                    self.team2_minion_1.receive_analysis_results(facial_expression, gesture)
-                    self.team2_minion_2.receive_analysis_results(facial_expression, gesture)
-                    self.team2_signal = True
+            except Exception as e:
+                logger.error("Error analysing gesture for team %s: %s", team_id, e)
+                # Still report back so the in-flight count is released
+                result = None
+            # pygame's event queue is thread-safe; EventHandler passes this to finish_gesture_analysis
+            pygame.event.post(pygame.event.Event(GESTURE_DONE, team_id=team_id, result=result))
                 
-                self.ui_manager.ai_button.text = "Thinking....."
+        self._gesture_queries_in_flight = 2
+        future_team1.add_done_callback(lambda f: post_analysis_result(f, 1))
+        future_team2.add_done_callback(lambda f: post_analysis_result(f, 2))
+
+    def finish_gesture_analysis(self, team_id, result):
+        """Apply one team's gesture analysis on the main thread"""
+        self._gesture_queries_in_flight = max(0, self._gesture_queries_in_flight - 1)
+        if result is None:
+            return
+        try:
+            facial_expression = result.get("facial_expressions", "Unknown")
+            gesture = result.get("gestures", "Unknown")
+            
+            # Print the complete analysis
+            logger.info("Analysis result: Facial expression: %s, Gesture: %s", facial_expression, gesture)
+            
+            # Get current team's guide
+            current_guide = self.team1_guide if team_id == 1 else self.team2_guide
+            
+            # Send the analysis results to both the current minion and guide
+            if team_id == 1:
+                self.team1_minion_1.receive_analysis_results(facial_expression, gesture)
+                self.team1_minion_2.receive_analysis_results(facial_expression, gesture)
+                self.team1_signal = True
+            elif team_id == 2:
+                self.team2_minion_1.receive_analysis_results(facial_expression, gesture)
+                self.team2_minion_2.receive_analysis_results(facial_expression, gesture)
+                self.team2_signal = True
+            
+            self.ui_manager.ai_button.set_text("Thinking.....")
 
-                understood_guide = current_guide.receive_detection_results(facial_expression, gesture)
-                
-                if understood_guide:
-                    print(f"Team {team_id} minion understood the gesture")
-                else:
-                    print(f"Team {team_id} minion ignored the unclear gesture")
-                    
-                # Add team info to the gesture display
-                display_text = f"Team {team_id} - Expression: {facial_expression}\nGesture: {gesture}"
-                
-                # Update the webcam display directly
-                self.ui_manager.webcam_display.set_analysis_text(display_text)
-                
-            except Exception as e:
-                print(f"Error processing analysis result: {e}")
+            understood_guide = current_guide.receive_detection_results(facial_expression, gesture)
+            
+            if understood_guide:
+                logger.info("Team %s minion understood the gesture", team_id)
+            else:
+                logger.info("Team %s minion ignored the unclear gesture", team_id)
                 
-        future_team1.add_done_callback(lambda f: process_analysis_result(f, 1))
-        future_team2.add_done_callback(lambda f: process_analysis_result(f, 2))
+            # Add team info to the gesture display
+            display_text = f"Team {team_id} - Expression: {facial_expression}\nGesture: {gesture}"
+            
+            # Update the webcam display directly
+            self.ui_manager.webcam_display.set_analysis_text(display_text)
+            
+        except Exception as e:
+            logger.error("Error processing analysis result: %s", e)
 
     def on_video_playback_complete(self):
         """Handle completion of a video playback"""
         # This gets called when the video is finished playing
         # We can use this to do any cleanup or additional effects after the video
-        print("Video playback complete - Game notified")
+        logger.info("Video playback complete - Game notified")
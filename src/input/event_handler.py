@@ -4,6 +4,11 @@ Event handling for the game
 import pygame
 import sys
 
+# Posted from the asyncio thread when all four minions have decided; carries a "results" list
+AI_TURN_DONE = pygame.USEREVENT + 1
+# Posted from the asyncio thread when one team's gesture analysis returns; carries "team_id" and "result"
+GESTURE_DONE = pygame.USEREVENT + 2
+
 class EventHandler:
     def __init__(self, game):
         self.game = game
@@ -13,6 +18,14 @@ class EventHandler:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.quit_game()
+
+            # AI decisions for the turn are ready
+            if event.type == AI_TURN_DONE:
+                self.game.finish_ai_turn(event.turn_id, event.results)
+
+            # A team's gesture analysis is ready
+            if event.type == GESTURE_DONE:
+                self.game.finish_gesture_analysis(event.team_id, event.result)
             
             # Handle mouse events
             if event.type == pygame.MOUSEMOTION:
@@ -48,6 +61,7 @@ class EventHandler:
     
     def quit_game(self):
         """Exit the game"""
+        # Game.run releases the webcam on the way out
         pygame.quit()
         sys.exit()
     
@@ -3,6 +3,7 @@ Board rendering for the game
 """
 import pygame
 from src.utils.constants import GRAY, WHITE
+from src.rendering.ui import render_text
 
 class BoardRenderer:
     def __init__(self, board_x, board_y, grid_width, grid_height, tile_size, sprites):
@@ -16,6 +17,22 @@ class BoardRenderer:
         # Create a transparent version of the empty tile
         self.create_transparent_tile()
         
+        # The board background and checkerboard never change, so they are drawn once into a display-format surface
+        self.create_background()
+        
+        # Top-left pixel of every cell, indexed [y][x]
+        self.cell_positions = [
+            [(board_x + x * tile_size, board_y + y * tile_size) for x in range(grid_width)]
+            for y in range(grid_height)
+        ]
+        
+        # Sprite for each grid code (0 = empty, 1-3 items, 4-7 minions)
+        sprite_names = ["sushi", "donut", "banana", "team1_minion_1", "team1_minion_2", "team2_minion_1", "team2_minion_2"]
+        self.cell_sprites = [None] + [self.sprites.sprites[name] for name in sprite_names]
+        
+        # Full-screen game over overlay, created on first use since the screen size is only known then
+        self.game_over_overlay = None
+        
     def create_transparent_tile(self):
         """Create a transparent version of the empty tile for checkerboard pattern"""
         # Get the original empty tile
@@ -30,50 +47,27 @@ class BoardRenderer:
         # Apply the transparency by blitting with BLEND_RGBA_MULT
         self.transparent_tile.blit(alpha_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
         
-    def draw(self, screen, grid):
-        """Draw the game board with all elements"""
-        # Draw board background
-        pygame.draw.rect(
-            screen, 
-            GRAY, 
-            (self.board_x, self.board_y, 
-             self.grid_width * self.tile_size, 
-             self.grid_height * self.tile_size)
-        )
-        
-        # Draw grid cells
+    def create_background(self):
+        """Pre-render the gray board background with its checkerboard of empty tiles"""
+        self.background = pygame.Surface((self.grid_width * self.tile_size, self.grid_height * self.tile_size)).convert()
+        self.background.fill(GRAY)
         for y in range(self.grid_height):
             for x in range(self.grid_width):
-                # Calculate position
-                rect_x = self.board_x + (x * self.tile_size)
-                rect_y = self.board_y + (y * self.tile_size)
-                
-                # Get tile type
-                item_code = grid[y][x]
-                
-                # Draw the colored tile background with checkerboard pattern
-                if (x + y) % 2 == 0:
-                    # Use normal empty tile
-                    screen.blit(self.sprites.tile_surfaces[0], (rect_x, rect_y))
-                else:
-                    # Use transparent empty tile
-                    screen.blit(self.transparent_tile, (rect_x, rect_y))
-                
+                # Normal empty tile on even squares, transparent one on odd squares
+                tile = self.sprites.tile_surfaces[0] if (x + y) % 2 == 0 else self.transparent_tile
+                self.background.blit(tile, (x * self.tile_size, y * self.tile_size))
+        
+    def draw(self, screen, grid):
+        """Draw the game board with all elements"""
+        # One blit for the static background, then the cell contents, all handed to SDL in a single blits() call
+        batch = [(self.background, (self.board_x, self.board_y))]
+        cell_sprites = self.cell_sprites
+        for row, positions in zip(grid.tolist(), self.cell_positions):
+            for item_code, pos in zip(row, positions):
                 # Draw cell content based on code
-                if item_code == 1:  # Sushi
-                    screen.blit(self.sprites.sprites["sushi"], (rect_x, rect_y))
-                elif item_code == 2:  # Donut
-                    screen.blit(self.sprites.sprites["donut"], (rect_x, rect_y))
-                elif item_code == 3:  # Banana
-                    screen.blit(self.sprites.sprites["banana"], (rect_x, rect_y))
-                elif item_code == 4:  # Team 1 Minion 1
-                    screen.blit(self.sprites.sprites["team1_minion_1"], (rect_x, rect_y))
-                elif item_code == 5:  # Team 1 Minion 2
-                    screen.blit(self.sprites.sprites["team1_minion_2"], (rect_x, rect_y))
-                elif item_code == 6:  # Team 2 Minion 1
-                    screen.blit(self.sprites.sprites["team2_minion_1"], (rect_x, rect_y))
-                elif item_code == 7:  # Team 2 Minion 2
-                    screen.blit(self.sprites.sprites["team2_minion_2"], (rect_x, rect_y))
+                if item_code:
+                    batch.append((cell_sprites[item_code], pos))
+        screen.blits(batch, doreturn=False)
     
     def draw_sidebar(self, screen, game_state, font, small_font):
         """Draw the sidebar with game information"""
@@ -157,20 +151,23 @@ class BoardRenderer:
     
     def draw_game_over(self, screen, winner, screen_width, screen_height, font, small_font):
         """Draw the game over screen"""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # Semi-transparent black
-        screen.blit(overlay, (0, 0))
+        # Semi-transparent overlay, built once and reused while the game over screen is up
+        if self.game_over_overlay is None or self.game_over_overlay.get_size() != (screen_width, screen_height):
+            self.game_over_overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+            self.game_over_overlay.fill((0, 0, 0, 180))  # Semi-transparent black
+        screen.blit(self.game_over_overlay, (0, 0))
         
+        # Labels go through the shared render_text cache rather than being rasterised every frame
         if winner == 0:
-            result_text = font.render("Game Over: Draw!", True, WHITE)
+            result_text = render_text(font, "Game Over: Draw!", WHITE)
         else:
             team_color = self.sprites.sprites["team1_minion_1"].get_at((self.tile_size//2, self.tile_size//2)) if winner == 1 else self.sprites.sprites["team2_minion_1"].get_at((self.tile_size//2, self.tile_size//2))
-            result_text = font.render(f"Game Over: Team {winner} Wins!", True, team_color)
+            # pygame.Color is mutable and unhashable, so the cache key uses a plain tuple
+            result_text = render_text(font, f"Game Over: Team {winner} Wins!", tuple(team_color))
             
         text_rect = result_text.get_rect(center=(screen_width//2, screen_height//2))
         screen.blit(result_text, text_rect)
         
-        restart_text = small_font.render("Press R to restart", True, WHITE)
+        restart_text = render_text(small_font, "Press R to restart", WHITE)
         restart_rect = restart_text.get_rect(center=(screen_width//2, screen_height//2 + 40))
         screen.blit(restart_text, restart_rect) 
\ No newline at end of file
@@ -2,6 +2,7 @@
 Sprite management for the game
 """
 import pygame
+import numpy as np
 import os
 from src.utils.constants import WHITE, BLACK, TILE_COLORS, TILE_SIZE
 
@@ -10,6 +11,8 @@ class SpriteManager:
         self.tile_size = tile_size
         self.sprites = {}
         self.tile_surfaces = {}
+        # SysFont searches and parses font files, so the emoji font is loaded once for every item sprite
+        self.item_font = pygame.font.SysFont('Arial', tile_size//2)
         self.initialize_sprites()
         
     def initialize_sprites(self):
@@ -99,7 +102,22 @@ class SpriteManager:
             # Return a pink error surface
             surf = pygame.Surface((self.tile_size, self.tile_size), pygame.SRCALPHA)
             surf.fill((255, 0, 255, 180))
-            return surf
+            return surf.convert_alpha()
+    
+    def add_texture(self, surf, color, size, spots=10):
+        """Sprinkle small squares of slightly lighter or darker color over a solid tile"""
+        # Draw every spot's position, side and shade up front instead of three randint calls per spot
+        xs = np.random.randint(0, size - 5, spots)
+        ys = np.random.randint(0, size - 5, spots)
+        sides = np.random.randint(3, 7, spots)
+        shades = np.random.randint(-20, 21, (spots, 1))
+        spot_colors = np.clip(np.array(color, dtype=np.int16) + shades, 0, 255)
+        
+        # surfarray is indexed [x, y]; the pixel view locks the surface until it is deleted
+        pixels = pygame.surfarray.pixels3d(surf)
+        for x, y, side, spot_color in zip(xs, ys, sides, spot_colors):
+            pixels[x:x + side, y:y + side] = spot_color
+        del pixels
     
     def create_empty_tile(self, size):
         """Create an empty tile (grass)"""
@@ -107,20 +125,13 @@ class SpriteManager:
         surf.fill(TILE_COLORS["empty"])
         
         # Add some texture
-        import random
-        for _ in range(10):
-            shade = random.randint(-20, 20)
-            color = TILE_COLORS["empty"]
-            texture_color = tuple(min(255, max(0, c + shade)) for c in color)
-            x = random.randint(0, size - 6)
-            y = random.randint(0, size - 6)
-            size_dots = random.randint(3, 6)
-            pygame.draw.rect(surf, texture_color, (x, y, size_dots, size_dots))
+        self.add_texture(surf, TILE_COLORS["empty"], size)
         
         # Add grid line
         pygame.draw.rect(surf, (0, 0, 0), (0, 0, size, size), 1)
         
-        return surf
+        # Match the display format once so board blits don't convert pixels every frame
+        return surf.convert()
     
     def create_minion_sprite(self, color, size):
         """Create a simple minion sprite with the given color"""
@@ -139,15 +150,14 @@ class SpriteManager:
         # Draw smile
         pygame.draw.arc(surf, BLACK, (size//3, size//2, size//3, size//4), 0, 3.14, 2)
         
-        return surf
+        return surf.convert_alpha()
     
     def create_item_sprite(self, emoji, size):
         """Create a sprite for an item using emojis on a colored background"""
         surf = pygame.Surface((size, size), pygame.SRCALPHA)
         
         # Render the emoji text
-        font = pygame.font.SysFont('Arial', size//2)
-        text = font.render(emoji, True, WHITE)
+        text = self.item_font.render(emoji, True, WHITE)
         text_rect = text.get_rect(center=(size//2, size//2))
         
         # Add a circle background
@@ -165,7 +175,7 @@ class SpriteManager:
         # Add the emoji
         surf.blit(text, text_rect)
         
-        return surf
+        return surf.convert_alpha()
     
     def create_tile(self, tile_type, size):
         """Create a colored tile with texture or use loaded sprite"""
@@ -217,17 +227,9 @@ class SpriteManager:
         surf.fill(color)
         
         # Add some texture to tiles
-        import random
-        for _ in range(10):
-            # Add slightly different colored pixels for texture
-            shade = random.randint(-20, 20)
-            texture_color = tuple(min(255, max(0, c + shade)) for c in color)
-            x = random.randint(0, size - 6)
-            y = random.randint(0, size - 6)
-            size_dots = random.randint(3, 6)
-            pygame.draw.rect(surf, texture_color, (x, y, size_dots, size_dots))
+        self.add_texture(surf, color, size)
         
         # Add grid lines
         pygame.draw.rect(surf, (0, 0, 0), (0, 0, size, size), 1)
         
-        return surf 
+        return surf.convert()
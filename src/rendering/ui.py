@@ -1,6 +1,7 @@
 """
 UI components for the game
 """
+import functools
 import pygame
 import numpy as np
 from src.utils.constants import WHITE, BLACK, BUTTON_COLOR, BUTTON_HOVER_COLOR, PREVIEW_GAP, SPEECH_BG, SCREEN_WIDTH, SCREEN_HEIGHT
@@ -32,6 +33,11 @@ def create_gradient_background(colors, height=SCREEN_HEIGHT):
     
     return surface
 
+@functools.lru_cache(maxsize=512)
+def render_text(font, text, color):
+    """Render anti-aliased text once per (font, text, color) and reuse the surface on later frames"""
+    return font.render(text, True, color)
+
 class Button:
     def __init__(self, rect, text, font, color=BUTTON_COLOR, hover_color=BUTTON_HOVER_COLOR):
         self.rect = rect
@@ -40,6 +46,8 @@ class Button:
         self.color = color
         self.hover_color = hover_color
         self.hover = False
+        # Set whenever the label or hover state changes; UIManager clears it once the button is drawn
+        self.dirty = True
         
     def draw(self, screen):
         """Draw the button on the screen"""
@@ -47,13 +55,22 @@ class Button:
         pygame.draw.rect(screen, color, self.rect, border_radius=6)
         pygame.draw.rect(screen, WHITE, self.rect, 3, border_radius=6)
         
-        text_surface = self.font.render(self.text, True, WHITE)
+        text_surface = render_text(self.font, self.text, WHITE)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
         
+    def set_text(self, text):
+        """Change the button label"""
+        if text != self.text:
+            self.text = text
+            self.dirty = True
+        
     def update(self, mouse_pos):
         """Update button state based on mouse position"""
-        self.hover = self.rect.collidepoint(mouse_pos)
+        hover = self.rect.collidepoint(mouse_pos)
+        if hover != self.hover:
+            self.hover = hover
+            self.dirty = True
         
     def is_clicked(self, mouse_pos):
         """Check if the button was clicked"""
@@ -90,7 +107,7 @@ class DialogueBox:
         bubble_y = board_y + (minion_pos[0] * tile_size) - 60
         
         # Create dialogue text
-        dialogue_text = self.font.render(self.dialogue, True, WHITE)
+        dialogue_text = render_text(self.font, self.dialogue, WHITE)
         dialogue_rect = dialogue_text.get_rect(center=(bubble_x, bubble_y))
         
         # Draw bubble background
@@ -113,7 +130,7 @@ class DialogueBox:
         # Draw thought bubble (if space permits)
         if self.thought and bubble_y > 100:
             thought_y = bubble_y - 40
-            thought_text = self.thought_font.render(f"({self.thought})", True, WHITE)
+            thought_text = render_text(self.thought_font, f"({self.thought})", WHITE)
             thought_rect = thought_text.get_rect(center=(bubble_x, thought_y))
             
             # Draw thought bubble background
@@ -135,54 +152,56 @@ class DialogueBox:
 class WebcamDisplay:
     def __init__(self, x, y, width, height, btn_font):
         self.rect = pygame.Rect(x, y, width, height)
+        # Half-width preview slots to the right of the feed, 30px apart; the layout is fixed, so build them once
+        preview_x1 = self.rect.x + self.rect.width + 30
+        self.preview_rect1 = pygame.Rect(preview_x1, self.rect.y, self.rect.width/2, self.rect.height)
+        self.preview_rect2 = pygame.Rect(preview_x1 + self.rect.width/2 + 30, self.rect.y, self.rect.width/2, self.rect.height)
         self.btn_font = btn_font
-        self.last_frame = None
         self.captured_preview_team1 = None
         self.captured_preview_team2 = None
         self.analysis_text = None
+        # Set whenever a preview or the analysis text changes; the live feed is tracked by the game
+        self.dirty = True
         
-    def draw_camera_feed(self, screen, frame_surface):
-        """Draw the camera feed"""
+    def draw_camera_feed(self, screen, frame_surface, webcam_available):
+        """Draw the camera feed, or the matching placeholder when there is no frame"""
         if frame_surface is not None:
             screen.blit(frame_surface, self.rect)
             pygame.draw.rect(screen, WHITE, self.rect, 2)
         else:
-            self.draw_placeholder(screen, "Camera Unavailable")
+            self.draw_placeholder(screen, "Camera Error" if webcam_available else "No Camera")
     
     def draw_placeholder(self, screen, message):
         """Draw a placeholder when camera is unavailable"""
         pygame.draw.rect(screen, (100, 100, 100), self.rect)
-        text = self.btn_font.render(message, True, WHITE)
-        screen.blit(text, text.get_rect(center=(self.rect.centerx, self.rect.centery)))
+        text = render_text(self.btn_font, message, WHITE)
+        screen.blit(text, text.get_rect(center=self.rect.center))
     
     def draw_preview(self, screen):
         """Draw the captured frame previews side by side"""
         if self.captured_preview_team1 is not None and self.captured_preview_team2 is not None:
             # Position the first preview
-            preview_x1 = self.rect.x + self.rect.width + 30
-            preview_rect1 = pygame.Rect(preview_x1, self.rect.y, self.rect.width/2, self.rect.height)
-            
-            screen.blit(self.captured_preview_team1, preview_rect1)
-            pygame.draw.rect(screen, WHITE, preview_rect1, 2)
+            screen.blit(self.captured_preview_team1, self.preview_rect1)
+            pygame.draw.rect(screen, WHITE, self.preview_rect1, 2)
             
             # Position the second preview
-            preview_x2 = preview_x1 + self.rect.width/2  + 30
-            preview_rect2 = pygame.Rect(preview_x2, self.rect.y, self.rect.width/2, self.rect.height)
-
-            screen.blit(self.captured_preview_team2, preview_rect2)
-            pygame.draw.rect(screen, WHITE, preview_rect2, 2)
+            screen.blit(self.captured_preview_team2, self.preview_rect2)
+            pygame.draw.rect(screen, WHITE, self.preview_rect2, 2)
 
     def set_captured_preview_team1(self, surface):
         """Set the preview of the captured frame"""
         self.captured_preview_team1 = surface
+        self.dirty = True
 
     def set_captured_preview_team2(self, surface):
         """Set the preview of the captured frame"""
         self.captured_preview_team2 = surface
+        self.dirty = True
         
     def set_analysis_text(self, text):
         """Set the analysis text results"""
         self.analysis_text = text
+        self.dirty = True
 
 class TeamView:
     """A modern UI component that displays team information in a Tailwind-like style"""
@@ -198,6 +217,11 @@ class TeamView:
         self.targets = []
         self.collected = []
         
+        # Item icons scaled to panel size, and the targets row pre-composed from them
+        self.icons = {}
+        self.target_strip = None
+        self.target_strip_targets = None
+        
         # History storage - for step by step tracking
         self.step_history = []
         self.current_step = 0
@@ -216,8 +240,13 @@ class TeamView:
         self.scroll_bar_active = False
         self.scroll_drag_start = None
         
+        # Set whenever anything the panel shows changes; UIManager clears it once the panel is drawn
+        self.dirty = True
+        
     def update(self, targets, collected, thought1, dialogue1, move1, thought2, dialogue2, move2, step_count=None, should_add_history=True):
         """Update the team information"""
+        if targets != self.targets or collected != self.collected:
+            self.dirty = True
         self.targets = targets
         self.collected = collected
         
@@ -230,6 +259,7 @@ class TeamView:
                 self.current_step += 1
                 
             # Add new step at the beginning of the list (most recent first)
+            self.dirty = True
             self.step_history.insert(0, {
                 'step': self.current_step,
                 'minion1': {
@@ -249,9 +279,11 @@ class TeamView:
         self.step_history = []
         self.current_step = 0
         self.scroll_offset = 0
+        self.dirty = True
         
     def handle_scroll(self, event):
         """Handle scroll events"""
+        before = (self.scroll_offset, self.scroll_bar_active)
         if event.type == pygame.MOUSEWHEEL:
             # Check if mouse is over this panel
             mouse_pos = pygame.mouse.get_pos()
@@ -285,6 +317,9 @@ class TeamView:
                 self.scroll_offset += scroll_amount
                 self.scroll_drag_start = event.pos[1]
                 self.clamp_scroll()
+        
+        if (self.scroll_offset, self.scroll_bar_active) != before:
+            self.dirty = True
     
     def clamp_scroll(self):
         """Ensure scroll offset stays within valid range"""
@@ -293,6 +328,31 @@ class TeamView:
         elif self.scroll_offset > self.max_scroll:
             self.scroll_offset = self.max_scroll
         
+    def get_icon(self, item, size):
+        """Item sprite scaled to size, scaled once and cached; None if there is no sprite"""
+        icon = self.icons.get(item)
+        if icon is None:
+            sprite_name = ["", "sushi", "donut", "banana"][item]
+            if not sprite_name or sprite_name not in self.sprites.sprites:
+                return None
+            icon = pygame.transform.scale(self.sprites.sprites[sprite_name], (size, size))
+            self.icons[item] = icon
+        return icon
+    
+    def get_target_strip(self, size, gap):
+        """The row of target icons, re-composed only when the targets change"""
+        targets = tuple(self.targets)
+        if self.target_strip is None or targets != self.target_strip_targets:
+            self.target_strip = pygame.Surface((max(1, len(targets) * (size + gap)), size), pygame.SRCALPHA)
+            for i, target in enumerate(targets):
+                sprite = self.get_icon(target, size)
+                if sprite is not None:
+                    # MAX against the cleared strip copies the icon's pixels and alpha as is, so
+                    # semi-transparent icons are not blended twice when the strip goes onto the panel
+                    self.target_strip.blit(sprite, (i * (size + gap), 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.target_strip_targets = targets
+        return self.target_strip
+    
     def draw(self, screen):
         """Draw the team information panel with modern UI style and scrolling"""
         # Draw main container with rounded corners
@@ -305,7 +365,7 @@ class TeamView:
         
         # Team header
         header_text = f"Team {self.team_id}"
-        header_surf = self.font_large.render(header_text, True, self.accent_color)
+        header_surf = render_text(self.font_large, header_text, self.accent_color)
         header_rect = header_surf.get_rect(topleft=(20, 20))
         panel_surface.blit(header_surf, header_rect)
         
@@ -313,34 +373,29 @@ class TeamView:
         y_pos = header_rect.bottom + 15
         
         # Targets section
-        section_title = self.font_medium.render("Targets", True, self.text_color)
+        section_title = render_text(self.font_medium, "Targets", self.text_color)
         panel_surface.blit(section_title, (20, y_pos))
         y_pos += section_title.get_height() + 10
         
-        # Draw target sprites horizontally
+        # Draw target sprites horizontally; targets only change on reset, so the row is one blit
         sprite_size = 40
         sprite_gap = 5
-        for i, target in enumerate(self.targets):
-            sprite_name = ["", "sushi", "donut", "banana"][target]
-            if sprite_name and sprite_name in self.sprites.sprites:
-                sprite = pygame.transform.scale(self.sprites.sprites[sprite_name], (sprite_size, sprite_size))
-                panel_surface.blit(sprite, (20 + i * (sprite_size + sprite_gap), y_pos))
+        panel_surface.blit(self.get_target_strip(sprite_size, sprite_gap), (20, y_pos))
         
         y_pos += sprite_size + 20
         
         # Collected items section
-        section_title = self.font_medium.render("Collected", True, self.text_color)
+        section_title = render_text(self.font_medium, "Collected", self.text_color)
         panel_surface.blit(section_title, (20, y_pos))
         y_pos += section_title.get_height() + 10
         
         # Draw collected sprites in a grid (4 per row)
         items_per_row = 4
         for i, item in enumerate(self.collected):
-            sprite_name = ["", "sushi", "donut", "banana"][item]
-            if sprite_name and sprite_name in self.sprites.sprites:
+            sprite = self.get_icon(item, sprite_size)
+            if sprite is not None:
                 row = i // items_per_row
                 col = i % items_per_row
-                sprite = pygame.transform.scale(self.sprites.sprites[sprite_name], (sprite_size, sprite_size))
                 panel_surface.blit(sprite, (20 + col * (sprite_size + sprite_gap), y_pos + row * (sprite_size + sprite_gap)))
         
         # Calculate height based on number of collected items
@@ -361,7 +416,7 @@ class TeamView:
                 step_number = step_data['step']
                 
                 # Draw step header with step number
-                step_title = self.font_medium.render(f"Step {step_number}", True, self.accent_color)
+                step_title = render_text(self.font_medium, f"Step {step_number}", self.accent_color)
                 content_surface.blit(step_title, (20, content_y_pos))
                 content_y_pos += step_title.get_height() + 10
                 
@@ -372,89 +427,89 @@ class TeamView:
                 content_y_pos += 10
                 
                 # Minion 1 section
-                minion1_title = self.font_medium.render("Minion 1", True, self.text_color)
+                minion1_title = render_text(self.font_medium, "Minion 1", self.text_color)
                 content_surface.blit(minion1_title, (20, content_y_pos))
                 content_y_pos += minion1_title.get_height() + 5
                 
                 # Minion 1 thought
                 if step_data['minion1']['thought']:
-                    thought_title = self.font_small.render("Thought:", True, (150, 150, 150))
+                    thought_title = render_text(self.font_small, "Thought:", (150, 150, 150))
                     content_surface.blit(thought_title, (30, content_y_pos))
                     content_y_pos += thought_title.get_height() + 2
                     
                     thought_lines = self._wrap_text(step_data['minion1']['thought'], self.font_small, self.rect.width - 80)
                     for line in thought_lines:
-                        line_surf = self.font_small.render(line, True, (180, 180, 180))
+                        line_surf = render_text(self.font_small, line, (180, 180, 180))
                         content_surface.blit(line_surf, (40, content_y_pos))
                         content_y_pos += line_surf.get_height() + 2
                     content_y_pos += 5
                 
                 # Minion 1 dialogue
                 if step_data['minion1']['dialogue']:
-                    dialogue_title = self.font_small.render("Dialogue:", True, self.text_color)
+                    dialogue_title = render_text(self.font_small, "Dialogue:", self.text_color)
                     content_surface.blit(dialogue_title, (30, content_y_pos))
                     content_y_pos += dialogue_title.get_height() + 2
                     
                     dialogue_lines = self._wrap_text(step_data['minion1']['dialogue'], self.font_small, self.rect.width - 80)
                     for line in dialogue_lines:
-                        line_surf = self.font_small.render(line, True, self.text_color)
+                        line_surf = render_text(self.font_small, line, self.text_color)
                         content_surface.blit(line_surf, (40, content_y_pos))
                         content_y_pos += line_surf.get_height() + 2
                     content_y_pos += 5
                 
                 # Minion 1 move
                 if step_data['minion1']['move']:
-                    move_title = self.font_small.render("Move:", True, self.text_color)
+                    move_title = render_text(self.font_small, "Move:", self.text_color)
                     content_surface.blit(move_title, (30, content_y_pos))
                     content_y_pos += move_title.get_height() + 2
                     
-                    move_text = self.font_small.render(step_data['minion1']['move'], True, self.text_color)
+                    move_text = render_text(self.font_small, step_data['minion1']['move'], self.text_color)
                     content_surface.blit(move_text, (40, content_y_pos))
                     content_y_pos += move_text.get_height() + 10
                 
                 # Minion 2 section
-                minion2_title = self.font_medium.render("Minion 2", True, self.text_color)
+                minion2_title = render_text(self.font_medium, "Minion 2", self.text_color)
                 content_surface.blit(minion2_title, (20, content_y_pos))
                 content_y_pos += minion2_title.get_height() + 5
                 
                 # Minion 2 thought
                 if step_data['minion2']['thought']:
-                    thought_title = self.font_small.render("Thought:", True, (150, 150, 150))
+                    thought_title = render_text(self.font_small, "Thought:", (150, 150, 150))
                     content_surface.blit(thought_title, (30, content_y_pos))
                     content_y_pos += thought_title.get_height() + 2
                     
                     thought_lines = self._wrap_text(step_data['minion2']['thought'], self.font_small, self.rect.width - 80)
                     for line in thought_lines:
-                        line_surf = self.font_small.render(line, True, (180, 180, 180))
+                        line_surf = render_text(self.font_small, line, (180, 180, 180))
                         content_surface.blit(line_surf, (40, content_y_pos))
                         content_y_pos += line_surf.get_height() + 2
                     content_y_pos += 5
                 
                 # Minion 2 dialogue
                 if step_data['minion2']['dialogue']:
-                    dialogue_title = self.font_small.render("Dialogue:", True, self.text_color)
+                    dialogue_title = render_text(self.font_small, "Dialogue:", self.text_color)
                     content_surface.blit(dialogue_title, (30, content_y_pos))
                     content_y_pos += dialogue_title.get_height() + 2
                     
                     dialogue_lines = self._wrap_text(step_data['minion2']['dialogue'], self.font_small, self.rect.width - 80)
                     for line in dialogue_lines:
-                        line_surf = self.font_small.render(line, True, self.text_color)
+                        line_surf = render_text(self.font_small, line, self.text_color)
                         content_surface.blit(line_surf, (40, content_y_pos))
                         content_y_pos += line_surf.get_height() + 2
                     content_y_pos += 5
                 
                 # Minion 2 move
                 if step_data['minion2']['move']:
-                    move_title = self.font_small.render("Move:", True, self.text_color)
+                    move_title = render_text(self.font_small, "Move:", self.text_color)
                     content_surface.blit(move_title, (30, content_y_pos))
                     content_y_pos += move_title.get_height() + 2
                     
-                    move_text = self.font_small.render(step_data['minion2']['move'], True, self.text_color)
+                    move_text = render_text(self.font_small, step_data['minion2']['move'], self.text_color)
                     content_surface.blit(move_text, (40, content_y_pos))
                     content_y_pos += move_text.get_height() + 20
         else:
             # Display a message when no history is available
-            no_history_text = self.font_small.render("No action history yet", True, (150, 150, 150))
+            no_history_text = render_text(self.font_small, "No action history yet", (150, 150, 150))
             content_surface.blit(no_history_text, (20, content_y_pos))
             content_y_pos += no_history_text.get_height() + 10
                 
@@ -2,14 +2,18 @@
 UI Manager - responsible for managing all UI components and layout
 """
 import pygame
+import numpy as np
 import os
 import random
+import logging
 from src.utils.constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE, GRID_WIDTH, GRID_HEIGHT,
+    SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE, GRID_WIDTH, GRID_HEIGHT, BOARD_X, BOARD_Y,
     WEBCAM_WIDTH, WEBCAM_HEIGHT, PREVIEW_GAP, GRADIENT_COLORS
 )
 from src.rendering.ui import Button, DialogueBox, WebcamDisplay, TeamView, create_gradient_background
 
+logger = logging.getLogger(__name__)
+
 class UIManager:
     """Manages all UI components and their layout"""
     def __init__(self, game):
@@ -24,31 +28,21 @@ class UIManager:
         
         # Create gradient background
         self.gradient_bg = create_gradient_background(GRADIENT_COLORS)
+
+        # The thinking indicator never changes, so render it once
+        self.thinking_text = self.font.render("Thinking...", True, (255, 255, 255))
+        self.thinking_rect = self.thinking_text.get_rect(center=(SCREEN_WIDTH//2, BOARD_Y - 30))
         
-        # Store separate dialogue and thoughts for each team
-        self.team1_minion_1_dialogue = ""
-        self.team1_minion_1_thought = ""
-        self.team1_minion_2_dialogue = ""
-        self.team1_minion_2_thought = ""
-        self.team2_minion_1_dialogue = ""
-        self.team2_minion_1_thought = ""
-        self.team2_minion_2_dialogue = ""
-        self.team2_minion_2_thought = ""
-        
-        # Store previous dialogue and thoughts to calculate deltas
-        self.prev_team1_minion_1_dialogue = ""
-        self.prev_team1_minion_1_thought = ""
-        self.prev_team1_minion_2_dialogue = ""
-        self.prev_team1_minion_2_thought = ""
-        self.prev_team2_minion_1_dialogue = ""
-        self.prev_team2_minion_1_thought = ""
-        self.prev_team2_minion_2_dialogue = ""
-        self.prev_team2_minion_2_thought = ""
+        # Dialogue and thought text added for each minion (1-4) since the last update(), which consumes it
+        self.minion_text = {minion_id: {"dialogue": "", "thought": ""} for minion_id in range(1, 5)}
         
         # Track AI turns for step counting
         self.ai_turn_count = 0
         self.last_ai_thinking = False
         
+        # Game-side values the last full draw showed, see needs_redraw()
+        self.drawn_state = None
+        
         # Initialize UI components
         self.init_layout()
         
@@ -57,10 +51,6 @@ class UIManager:
         
     def init_layout(self):
         """Initialize the layout of all UI components"""
-        # Calculate board position to center it - reduce top padding
-        self.BOARD_X = (SCREEN_WIDTH - (GRID_WIDTH * TILE_SIZE)) // 2
-        self.BOARD_Y = 30  # Reduced from 50 to 30
-        
         # Calculate sizes and positions for the team panels
         panel_width = 300
         # Make panels much taller to fill most of the screen
@@ -70,11 +60,11 @@ class UIManager:
         actual_panel_width = panel_width + 100
         
         # Left team panel (Team 1) - Positioned further left to avoid overlap with the board
-        team1_panel_x = self.BOARD_X - actual_panel_width - 20
+        team1_panel_x = BOARD_X - actual_panel_width - 20
         team1_panel_y = 30  # Align with top margin
         
         # Right team panel (Team 2) - Keep same position, it's already positioned correctly
-        team2_panel_x = self.BOARD_X + (GRID_WIDTH * TILE_SIZE) + 20
+        team2_panel_x = BOARD_X + (GRID_WIDTH * TILE_SIZE) + 20
         team2_panel_y = 30  # Align with top margin
         
         # Create team panels
@@ -92,7 +82,7 @@ class UIManager:
         self.dialogue_box = DialogueBox(self.font, self.thought_font)
         
         # Calculate button positions - reduce spacing
-        button_y = self.BOARD_Y + (GRID_HEIGHT * TILE_SIZE) + 20  # Reduced from 30 to 20
+        button_y = BOARD_Y + (GRID_HEIGHT * TILE_SIZE) + 20  # Reduced from 30 to 20
         button_width = 200
         button_height = 50  # Reduced from 60 to 50
         button_spacing = 30
@@ -126,6 +116,9 @@ class UIManager:
             WEBCAM_HEIGHT,
             self.btn_font
         )
+        
+        # Components that track their own changes with a dirty flag
+        self.widgets = (self.team1_panel, self.team2_panel, self.ai_button, self.webcam_button, self.webcam_display)
     
     def update(self, game_state, dialogue, thought, team1_1_last_move, team1_2_last_move, team2_1_last_move, team2_2_last_move, current_team, live_frame_surface, webcam_available, ai_thinking):
         """Update all UI components based on game state"""
@@ -136,16 +129,17 @@ class UIManager:
         ai_turn_completed = self.last_ai_thinking and not ai_thinking
         self.last_ai_thinking = ai_thinking
         
-        # Calculate new dialogue/thought content (delta from previous)
-        new_team1_minion_1_dialogue = self.team1_minion_1_dialogue[len(self.prev_team1_minion_1_dialogue):]
-        new_team1_minion_1_thought = self.team1_minion_1_thought[len(self.prev_team1_minion_1_thought):]
-        new_team1_minion_2_dialogue = self.team1_minion_2_dialogue[len(self.prev_team1_minion_2_dialogue):]
-        new_team1_minion_2_thought = self.team1_minion_2_thought[len(self.prev_team1_minion_2_thought):]
+        # New dialogue/thought content since the previous update
+        team1_minion_1, team1_minion_2, team2_minion_1, team2_minion_2 = (self.minion_text[minion_id] for minion_id in range(1, 5))
+        new_team1_minion_1_dialogue = team1_minion_1["dialogue"]
+        new_team1_minion_1_thought = team1_minion_1["thought"]
+        new_team1_minion_2_dialogue = team1_minion_2["dialogue"]
+        new_team1_minion_2_thought = team1_minion_2["thought"]
         
-        new_team2_minion_1_dialogue = self.team2_minion_1_dialogue[len(self.prev_team2_minion_1_dialogue):]
-        new_team2_minion_1_thought = self.team2_minion_1_thought[len(self.prev_team2_minion_1_thought):]
-        new_team2_minion_2_dialogue = self.team2_minion_2_dialogue[len(self.prev_team2_minion_2_dialogue):]
-        new_team2_minion_2_thought = self.team2_minion_2_thought[len(self.prev_team2_minion_2_thought):]
+        new_team2_minion_1_dialogue = team2_minion_1["dialogue"]
+        new_team2_minion_1_thought = team2_minion_1["thought"]
+        new_team2_minion_2_dialogue = team2_minion_2["dialogue"]
+        new_team2_minion_2_thought = team2_minion_2["thought"]
         
         # Only increment step counter if we've completed an AI turn AND we have actual new content
         has_team1_content = any([new_team1_minion_1_dialogue, new_team1_minion_1_thought, 
@@ -156,15 +150,15 @@ class UIManager:
                                 team2_1_last_move, new_team2_minion_2_dialogue, 
                                 new_team2_minion_2_thought, team2_2_last_move])
         
-        # Debug prints to trace the step creation logic
+        # Trace the step creation logic
         if ai_turn_completed:
-            print(f"AI turn completed. Has content: Team1={has_team1_content}, Team2={has_team2_content}")
-            print(f"Team1 moves: '{team1_1_last_move}', '{team1_2_last_move}'")
-            print(f"Team2 moves: '{team2_1_last_move}', '{team2_2_last_move}'")
+            logger.debug("AI turn completed. Has content: Team1=%s, Team2=%s", has_team1_content, has_team2_content)
+            logger.debug("Team1 moves: '%s', '%s'", team1_1_last_move, team1_2_last_move)
+            logger.debug("Team2 moves: '%s', '%s'", team2_1_last_move, team2_2_last_move)
         
         if ai_turn_completed and (has_team1_content or has_team2_content):
             self.ai_turn_count += 1
-            print(f"Creating new step {self.ai_turn_count}")
+            logger.debug("Creating new step %s", self.ai_turn_count)
         
         # Update team panels with their respective dialogue and thoughts
         self.team1_panel.update(
@@ -193,16 +187,8 @@ class UIManager:
             has_team2_content and ai_turn_completed  # Only add history if we have content and completed a turn
         )
         
-        # Save current dialogue/thoughts as previous for next update
-        self.prev_team1_minion_1_dialogue = self.team1_minion_1_dialogue
-        self.prev_team1_minion_1_thought = self.team1_minion_1_thought
-        self.prev_team1_minion_2_dialogue = self.team1_minion_2_dialogue
-        self.prev_team1_minion_2_thought = self.team1_minion_2_thought
-        
-        self.prev_team2_minion_1_dialogue = self.team2_minion_1_dialogue
-        self.prev_team2_minion_1_thought = self.team2_minion_1_thought
-        self.prev_team2_minion_2_dialogue = self.team2_minion_2_dialogue
-        self.prev_team2_minion_2_thought = self.team2_minion_2_thought
+        # The new content has been handed to the panels
+        self.clear_minion_text()
         
         # Update video playback
         self.update_video_playback()
@@ -217,53 +203,35 @@ class UIManager:
     
     def draw(self, screen, game_state, live_frame_surface, webcam_available, ai_thinking):
         """Draw all UI components to the screen"""
-        # Draw gradient background
-        screen.blit(self.gradient_bg, (0, 0))
-        
-        # Draw team panels
-        self.team1_panel.draw(screen)
-        self.team2_panel.draw(screen)
+        self.draw_background(screen)
+        self.draw_elements(screen, game_state, live_frame_surface, webcam_available, ai_thinking)
         
-        # Draw AI button
-        self.ai_button.draw(screen)
-        
-        # Draw webcam button
-        self.webcam_button.draw(screen)
-        
-        # Draw the live webcam feed or a placeholder
-        if live_frame_surface:
-            self.webcam_display.draw_camera_feed(screen, live_frame_surface)
-        elif webcam_available:
-            self.webcam_display.draw_placeholder(screen, "Camera Error")
+        # Everything on screen is now current. A video or confetti frame leaves no state to compare
+        # against, so the first frame after the animation ends is always drawn in full.
+        if self.playing_video or self.confetti_particles:
+            self.drawn_state = None
         else:
-            self.webcam_display.draw_placeholder(screen, "No Camera")
-        
-        # Draw webcam preview
-        self.webcam_display.draw_preview(screen)
-        
-        # Draw video overlay on the specific tile if playing
-        if self.playing_video and self.video_surface and self.video_tile_pos:
-            # Calculate the pixel position of the tile
-            tile_x = self.game.BOARD_X + self.video_tile_pos[1] * TILE_SIZE
-            tile_y = self.game.BOARD_Y + self.video_tile_pos[0] * TILE_SIZE
-            
-            # Draw the video surface at the tile position
-            screen.blit(self.video_surface, (tile_x, tile_y))
-        
-        # Draw confetti
-        self.draw_confetti(screen)
-        
-        # Draw AI thinking indicator
-        if ai_thinking:
-            thinking_text = self.font.render("Thinking...", True, (255, 255, 255))
-            thinking_rect = thinking_text.get_rect(center=(SCREEN_WIDTH//2, self.BOARD_Y - 30))
-            screen.blit(thinking_text, thinking_rect)
-        
-        # If game is over, draw game over screen
-        if game_state.game_over:
-            # This would be handled by the board renderer, not here
-            pass
-            
+            self.drawn_state = self.game_view_state(game_state, live_frame_surface, ai_thinking)
+        for widget in self.widgets:
+            widget.dirty = False
+    
+    def draw_camera_feed(self, screen, live_frame_surface, webcam_available):
+        """Redraw only the live webcam feed, for frames where nothing else changed"""
+        self.webcam_display.draw_camera_feed(screen, live_frame_surface, webcam_available)
+    
+    def game_view_state(self, game_state, live_frame_surface, ai_thinking):
+        """The game values drawn outside the widgets, compared by value between frames"""
+        return (game_state.grid.tobytes(), game_state.game_over, ai_thinking, live_frame_surface is None)
+    
+    def needs_redraw(self, game_state, live_frame_surface, ai_thinking):
+        """True if anything besides the live webcam feed changed since the last full draw"""
+        # Video and confetti move every frame
+        if self.playing_video or self.confetti_particles:
+            return True
+        if any(widget.dirty for widget in self.widgets):
+            return True
+        return self.game_view_state(game_state, live_frame_surface, ai_thinking) != self.drawn_state
+
     def is_ai_button_clicked(self, pos):
         """Check if the AI button was clicked"""
         return self.ai_button.is_clicked(pos)
@@ -285,6 +253,12 @@ class UIManager:
         self.video_surface = None
         self.video_tile_pos = None
         
+        # One tile-sized BGR buffer and the surface wrapping it, refilled in place for every video frame
+        self.video_frame = np.empty((TILE_SIZE, TILE_SIZE, 3), dtype=np.uint8)
+        self.video_frame_surface = pygame.image.frombuffer(self.video_frame, (TILE_SIZE, TILE_SIZE), "BGR")
+        # Decoded full-size frame, handed back to read() so it can decode into the same array
+        self.video_raw_frame = None
+        
         # Load minion celebration videos from minions folder
         self.videos = {
             1: os.path.join("assets", "minions", "videos", "green.mp4"),
@@ -332,8 +306,8 @@ class UIManager:
         self.confetti_start_time = pygame.time.get_ticks()
         
         # Calculate the pixel position of the tile
-        tile_x = self.BOARD_X + tile_pos[1] * TILE_SIZE
-        tile_y = self.BOARD_Y + tile_pos[0] * TILE_SIZE
+        tile_x = BOARD_X + tile_pos[1] * TILE_SIZE
+        tile_y = BOARD_Y + tile_pos[0] * TILE_SIZE
         
         # Create multiple confetti particles around the tile
         for _ in range(50):
@@ -361,17 +335,15 @@ class UIManager:
             
         # Read the next frame from the video
         import cv2
-        import numpy as np
         
         try:
-            ret, frame = self.video_capture.read()
+            ret, frame = self.video_capture.read(self.video_raw_frame)
             
             if ret:
-                # Resize the frame to the size of a single tile
-                frame = cv2.resize(frame, (TILE_SIZE, TILE_SIZE))
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                frame = np.rot90(frame)
-                self.video_surface = pygame.surfarray.make_surface(np.flipud(frame))
+                self.video_raw_frame = frame
+                # Resize the frame to the size of a single tile, straight into the buffer behind video_frame_surface
+                cv2.resize(frame, (TILE_SIZE, TILE_SIZE), dst=self.video_frame)
+                self.video_surface = self.video_frame_surface
             else:
                 # Video finished or error occurred, clean up
                 print("Video playback ended")
@@ -467,12 +439,7 @@ class UIManager:
         self.webcam_button.draw(screen)
         
         # Draw the live webcam feed or a placeholder
-        if live_frame_surface:
-            self.webcam_display.draw_camera_feed(screen, live_frame_surface)
-        elif webcam_available:
-            self.webcam_display.draw_placeholder(screen, "Camera Error")
-        else:
-            self.webcam_display.draw_placeholder(screen, "No Camera")
+        self.webcam_display.draw_camera_feed(screen, live_frame_surface, webcam_available)
         
         # Draw webcam preview
         self.webcam_display.draw_preview(screen)
@@ -480,8 +447,8 @@ class UIManager:
         # Draw video overlay on the specific tile if playing
         if self.playing_video and self.video_surface and self.video_tile_pos:
             # Calculate the pixel position of the tile
-            tile_x = self.game.BOARD_X + self.video_tile_pos[1] * TILE_SIZE
-            tile_y = self.game.BOARD_Y + self.video_tile_pos[0] * TILE_SIZE
+            tile_x = BOARD_X + self.video_tile_pos[1] * TILE_SIZE
+            tile_y = BOARD_Y + self.video_tile_pos[0] * TILE_SIZE
             
             # Draw the video surface at the tile position
             screen.blit(self.video_surface, (tile_x, tile_y))
@@ -491,21 +458,18 @@ class UIManager:
         
         # Draw AI thinking indicator
         if ai_thinking:
-            thinking_text = self.font.render("Thinking...", True, (255, 255, 255))
-            thinking_rect = thinking_text.get_rect(center=(SCREEN_WIDTH//2, self.BOARD_Y - 30))
-            screen.blit(thinking_text, thinking_rect) 
+            screen.blit(self.thinking_text, self.thinking_rect) 
 
     def reset_tracking(self):
         """Reset step counter and dialogue tracking for a new game"""
         self.ai_turn_count = 0
         self.last_ai_thinking = False
         
-        # Reset previous dialogue/thought tracking
-        self.prev_team1_minion_1_dialogue = ""
-        self.prev_team1_minion_1_thought = ""
-        self.prev_team1_minion_2_dialogue = ""
-        self.prev_team1_minion_2_thought = ""
-        self.prev_team2_minion_1_dialogue = ""
-        self.prev_team2_minion_1_thought = ""
-        self.prev_team2_minion_2_dialogue = ""
-        self.prev_team2_minion_2_thought = "" 
\ No newline at end of file
+        # Drop any dialogue/thought text not yet shown
+        self.clear_minion_text()
+
+    def clear_minion_text(self):
+        """Empty the per-minion dialogue and thought text"""
+        for entry in self.minion_text.values():
+            entry["dialogue"] = ""
+            entry["thought"] = ""
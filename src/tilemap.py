@@ -13,6 +13,9 @@ class TileMap:
         # Generate a more interesting tilemap layout
         self.generate_map()
         
+        # Pre-rendered map, built on the first draw since converting needs a display mode
+        self.surface = None
+        
     def load_tiles(self):
         """Load tile images or create placeholders if not available"""
         self.tile_images = {}
@@ -125,9 +128,18 @@ class TileMap:
                     if self.tilemap[ny][nx] == "grass":
                         self.tilemap[ny][nx] = "dirt"
     
+    def render(self):
+        """Render every tile once into a single display-format surface"""
+        self.surface = pygame.Surface((self.width * self.tile_size, self.height * self.tile_size)).convert()
+        self.surface.blits(
+            [(self.tile_images[self.tilemap[y][x]], (x * self.tile_size, y * self.tile_size))
+             for y in range(self.height) for x in range(self.width)],
+            doreturn=False
+        )
+        
     def draw(self, screen):
         """Draw the tilemap on the screen"""
-        for y in range(self.height):
-            for x in range(self.width):
-                tile_type = self.tilemap[y][x]
-                screen.blit(self.tile_images[tile_type], (x * self.tile_size, y * self.tile_size)) 
\ No newline at end of file
+        # The map never changes after generate_map, so each frame is a single blit of the cached render
+        if self.surface is None:
+            self.render()
+        screen.blit(self.surface, (0, 0))
@@ -11,9 +11,14 @@ TILE_SIZE = 80
 GRID_WIDTH = 10
 GRID_HEIGHT = 8
 
+# Board position (centered horizontally)
+BOARD_X = (SCREEN_WIDTH - (GRID_WIDTH * TILE_SIZE)) // 2
+BOARD_Y = 30
+
 # Webcam settings
 WEBCAM_WIDTH = 320
 WEBCAM_HEIGHT = 180
+WEBCAM_FPS = 30  # Live preview refresh rate; the game loop itself runs at 60
 
 # Game mechanics
 MAX_TURNS = 50
@@ -58,6 +63,14 @@ TEAM1_MINION_2 = 5
 TEAM2_MINION_1 = 6
 TEAM2_MINION_2 = 7
 
+# Move codes; the AI replies with strings, which are mapped to these once per decision
+MOVE_UP = 0
+MOVE_DOWN = 1
+MOVE_LEFT = 2
+MOVE_RIGHT = 3
+MOVE_STAY = 4
+MOVE_CODES = {"up": MOVE_UP, "down": MOVE_DOWN, "left": MOVE_LEFT, "right": MOVE_RIGHT, "stay": MOVE_STAY}
+
 # UI Settings
 PREVIEW_GAP = 8  # Vertical spacing between UI blocks
 DIALOGUE_DISPLAY_TIME = 3000  # 3 seconds 
@@ -3,7 +3,102 @@ Game state management
 """
 import numpy as np
 import random
-from src.utils.constants import GRID_HEIGHT, GRID_WIDTH, EMPTY, SUSHI, DONUT, BANANA, TEAM1_MINION_1, TEAM1_MINION_2, TEAM2_MINION_1, TEAM2_MINION_2, TILE_SIZE
+from collections import Counter
+
+from src.utils.constants import (
+    GRID_HEIGHT, GRID_WIDTH, EMPTY, SUSHI, DONUT, BANANA, TEAM1_MINION_1, TEAM1_MINION_2, TEAM2_MINION_1, TEAM2_MINION_2, TILE_SIZE,
+    MOVE_UP, MOVE_DOWN, MOVE_LEFT, MOVE_RIGHT, MOVE_STAY
+)
+
+# Numba is optional: without it the kernels below run as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# [dy, dx] offset for each move code; positions are 2-element int16 arrays so a move is a single vector add
+MOVE_TABLE = np.zeros((5, 2), dtype=np.int16)
+MOVE_TABLE[MOVE_UP] = (-1, 0)
+MOVE_TABLE[MOVE_DOWN] = (1, 0)
+MOVE_TABLE[MOVE_LEFT] = (0, -1)
+MOVE_TABLE[MOVE_RIGHT] = (0, 1)
+MOVE_TABLE[MOVE_STAY] = (0, 0)
+
+@njit(cache=True)
+def step_position(position, move_table, move_code, height, width):
+    """Apply one move to a [y, x] position, staying put if it would leave the grid"""
+    new_pos = position + move_table[move_code]
+    if 0 <= new_pos[0] < height and 0 <= new_pos[1] < width:
+        return new_pos
+    return position.copy()
+
+@njit(cache=True)
+def take_item(grid, y, x):
+    """Clear and return the item (1-3) at grid[y, x], or -1 if there is none"""
+    item = grid[y, x]
+    if 1 <= item <= 3:
+        grid[y, x] = 0
+        return int(item)
+    return -1
+
+# Outcome codes returned by resolve_collisions for each minion
+KEPT_MOVE = 0
+BUMPED = 1
+BUMPED_NO_ROOM = 2
+
+@njit(cache=True)
+def is_claimed(final, settled, y, x):
+    """True if a settled minion in final already holds [y, x]"""
+    for k in range(final.shape[0]):
+        if settled[k] and final[k, 0] == y and final[k, 1] == x:
+            return True
+    return False
+
+@njit(cache=True)
+def resolve_collisions(intended, powers, tiebreak, spawns, grid, move_table, adj_orders):
+    """
+    Settle one simultaneous turn. Minions aiming for the same cell are ranked by power, then
+    tiebreak; every loser is bumped, in index order, to the first free cell of:
+    1. its spawn position,
+    2. an EMPTY adjacent cell, tried in the minion's own row of adj_orders (MOVE_* codes),
+    3. its spawn position anyway (reported as BUMPED_NO_ROOM).
+    Returns (final positions, outcome code per minion).
+    """
+    n = intended.shape[0]
+    height, width = grid.shape
+    final = intended.copy()
+    outcome = np.zeros(n, dtype=np.int8)
+
+    # A minion loses if any other minion with the same target outranks it
+    for i in range(n):
+        for j in range(n):
+            if i != j and intended[i, 0] == intended[j, 0] and intended[i, 1] == intended[j, 1]:
+                if powers[j] > powers[i] or (powers[j] == powers[i] and (tiebreak[j] > tiebreak[i] or (tiebreak[j] == tiebreak[i] and j < i))):
+                    outcome[i] = BUMPED
+                    break
+
+    # Winners and unopposed minions keep their cells; bumped minions claim theirs one at a time
+    settled = outcome == KEPT_MOVE
+    for i in range(n):
+        if outcome[i] == KEPT_MOVE:
+            continue
+        spawn_y, spawn_x = spawns[i, 0], spawns[i, 1]
+        final[i, 0], final[i, 1] = spawn_y, spawn_x
+        if is_claimed(final, settled, spawn_y, spawn_x):
+            outcome[i] = BUMPED_NO_ROOM
+            for k in range(adj_orders.shape[1]):
+                move = adj_orders[i, k]
+                y = spawn_y + move_table[move, 0]
+                x = spawn_x + move_table[move, 1]
+                if 0 <= y < height and 0 <= x < width and grid[y, x] == EMPTY and not is_claimed(final, settled, y, x):
+                    final[i, 0], final[i, 1] = y, x
+                    outcome[i] = BUMPED
+                    break
+        settled[i] = True
+    return final, outcome
 
 class GameState:
     def __init__(self):
@@ -13,26 +108,27 @@ class GameState:
     def reset(self):
         """Reset the game to initial state"""
         # Grid representation
-        self.grid = np.zeros((GRID_HEIGHT, GRID_WIDTH), dtype=int)
+        self.grid = np.zeros((GRID_HEIGHT, GRID_WIDTH), dtype=np.uint8)
         
-        # Define spawn positions
-        self.TEAM1_1_SPAWN_POS = [3, 5]
-        self.TEAM1_2_SPAWN_POS = [0, 3]
-        self.TEAM2_1_SPAWN_POS = [5, 5]
-        self.TEAM2_2_SPAWN_POS = [GRID_HEIGHT - 1, GRID_WIDTH - 3]
+        # Define spawn positions ([y, x] int16 arrays, copied with .copy() rather than [:] which is a view)
+        self.TEAM1_1_SPAWN_POS = np.array([3, 5], dtype=np.int16)
+        self.TEAM1_2_SPAWN_POS = np.array([0, 3], dtype=np.int16)
+        self.TEAM2_1_SPAWN_POS = np.array([5, 5], dtype=np.int16)
+        self.TEAM2_2_SPAWN_POS = np.array([GRID_HEIGHT - 1, GRID_WIDTH - 3], dtype=np.int16)
 
-        self.team1_minion_1_pos = self.TEAM1_1_SPAWN_POS
-        self.team1_minion_2_pos = self.TEAM1_2_SPAWN_POS
-        self.team2_minion_1_pos = self.TEAM2_1_SPAWN_POS
-        self.team2_minion_2_pos = self.TEAM2_2_SPAWN_POS
+        self.team1_minion_1_pos = self.TEAM1_1_SPAWN_POS.copy()
+        self.team1_minion_2_pos = self.TEAM1_2_SPAWN_POS.copy()
+        self.team2_minion_1_pos = self.TEAM2_1_SPAWN_POS.copy()
+        self.team2_minion_2_pos = self.TEAM2_2_SPAWN_POS.copy()
         
         # Generate target items for each team
         self.team1_targets = self.generate_targets()
         self.team2_targets = self.generate_targets()
         
-        # Items collected by each team
-        self.team1_collected = []
-        self.team2_collected = []
+        # Items collected by each team. Tuples are rebuilt on every collection so the
+        # AI worker can read them without the main thread taking a snapshot copy.
+        self.team1_collected = ()
+        self.team2_collected = ()
         
         # Game status
         self.current_team = 1
@@ -42,17 +138,17 @@ class GameState:
         self.winner = None
         
         # Initialize grid with minions
-        self.grid[self.team1_minion_1_pos[0]][self.team1_minion_1_pos[1]] = TEAM1_MINION_1
-        self.grid[self.team1_minion_2_pos[0]][self.team1_minion_2_pos[1]] = TEAM1_MINION_2
-        self.grid[self.team2_minion_1_pos[0]][self.team2_minion_1_pos[1]] = TEAM2_MINION_1
-        self.grid[self.team2_minion_2_pos[0]][self.team2_minion_2_pos[1]] = TEAM2_MINION_2
+        self.grid[self.team1_minion_1_pos[0], self.team1_minion_1_pos[1]] = TEAM1_MINION_1
+        self.grid[self.team1_minion_2_pos[0], self.team1_minion_2_pos[1]] = TEAM1_MINION_2
+        self.grid[self.team2_minion_1_pos[0], self.team2_minion_1_pos[1]] = TEAM2_MINION_1
+        self.grid[self.team2_minion_2_pos[0], self.team2_minion_2_pos[1]] = TEAM2_MINION_2
         
         # Distribute items on the grid
         self.distribute_items()
     
     def generate_targets(self):
         """Generate 5 random items (1=sushi, 2=donut, 3=banana)"""
-        return [random.randint(1, 3) for _ in range(5)]
+        return tuple(random.randint(1, 3) for _ in range(5))
         
     def distribute_items(self):
         """Distribute items randomly on the grid"""
@@ -62,75 +158,55 @@ class GameState:
             BANANA: 10,
         }
         
-        # Place items randomly on empty cells
-        for item_type, count in num_items.items():
-            placed = 0
-            while placed < count:
-                x = random.randint(0, GRID_WIDTH-1)
-                y = random.randint(0, GRID_HEIGHT-1)
-                
-                # If the cell is empty, place the item
-                if self.grid[y][x] == EMPTY:
-                    self.grid[y][x] = item_type
-                    placed += 1
-    
-    def calculate_new_position(self, position, direction):
-        """Calculate a new position based on the current position and direction"""
-        new_pos = position.copy()
-        if direction == "up" and position[0] > 0:
-            new_pos[0] -= 1
-        elif direction == "down" and position[0] < GRID_HEIGHT - 1:
-            new_pos[0] += 1
-        elif direction == "left" and position[1] > 0:
-            new_pos[1] -= 1
-        elif direction == "right" and position[1] < GRID_WIDTH - 1:
-            new_pos[1] += 1
-        # "stay" does nothing
-        return new_pos
+        # Pick distinct empty cells in one draw rather than retrying random cells until one is free
+        items = np.repeat(np.array(list(num_items.keys()), dtype=self.grid.dtype), list(num_items.values()))
+        empties = np.argwhere(self.grid == EMPTY)
+        chosen = empties[np.random.choice(len(empties), size=len(items), replace=False)]
         
-    def check_item_collection(self, minion_pos, collected_items):
+        # The chosen cells are already in random order, so the item types need no shuffle
+        self.grid[chosen[:, 0], chosen[:, 1]] = items
+    
+    def calculate_new_position(self, position, move_code):
+        """Calculate a new position based on the current position and a MOVE_* code"""
+        # The result is always a fresh array
+        return step_position(position, MOVE_TABLE, move_code, GRID_HEIGHT, GRID_WIDTH)
+        
+    def in_bounds(self, positions):
+        """Boolean mask of which rows of an (N, 2) [y, x] position array lie on the grid"""
+        return np.logical_and.reduce((
+            positions[:, 0] >= 0, positions[:, 0] < GRID_HEIGHT,
+            positions[:, 1] >= 0, positions[:, 1] < GRID_WIDTH,
+        ))
+
+    def check_item_collection(self, minion_pos, team_id):
         """Check if the minion has collected an item, returns (collected, item_code)"""
-        y, x = minion_pos
-        item = self.grid[y][x]
-        
-        # If the position has an item (1-3), collect it
-        if 1 <= item <= 3:
-            collected_items.append(item)
-            # Clear the grid cell (set to empty)
-            self.grid[y][x] = 0
+        y, x = int(minion_pos[0]), int(minion_pos[1])
+        # Clears the grid cell and hands back a plain int item code, or -1
+        item = take_item(self.grid, y, x)
+        
+        # If the position had an item (1-3), collect it
+        if item != -1:
+            if team_id == 1:
+                self.team1_collected = (*self.team1_collected, item)
+            else:
+                self.team2_collected = (*self.team2_collected, item)
             return True, item
         
         return False, None
         
+    def targets_met(self, targets, collected):
+        """True if collected holds at least as many of each item as targets asks for"""
+        # Counter subtraction drops items that are covered, leaving only the shortfall
+        return not (Counter(targets) - Counter(collected))
+
     def check_win_conditions(self):
         """Check if a team has won"""
-        # Check if team 1 has collected all targets
-        team1_matches = 0
-        for item in self.team1_targets:
-            # Count how many of this item we need
-            needed = self.team1_targets.count(item)
-            # Count how many we have
-            collected = self.team1_collected.count(item)
-            # If we have enough of this item, count it as a match
-            if collected >= needed:
-                team1_matches += 1
-                
-        if team1_matches >= 5:
+        # A team wins once its collection covers its targets, duplicates included
+        if self.targets_met(self.team1_targets, self.team1_collected):
             self.game_over = True
             self.winner = 1
 
-        # Check if team 2 has collected all targets
-        team2_matches = 0
-        for item in self.team2_targets:
-            # Count how many of this item we need
-            needed = self.team2_targets.count(item)
-            # Count how many we have
-            collected = self.team2_collected.count(item)
-            # If we have enough of this item, count it as a match
-            if collected >= needed:
-                team2_matches += 1
-                
-        if team2_matches >= 5:
+        if self.targets_met(self.team2_targets, self.team2_collected):
             self.game_over = True
             self.winner = 2
         
@@ -140,46 +216,12 @@ class GameState:
             if self.winner is None:
                 self.winner = 0  # Draw
     
-    def find_available_spawn_or_adjacent(self, base_spawn_pos, grid, occupied_by_others_this_turn):
-        """
-        Finds an available position for a bumped minion.
-        Priority:
-        1. base_spawn_pos if not taken by another minion this turn.
-        2. An empty adjacent cell if not taken by another minion this turn.
-        3. base_spawn_pos as a last resort.
-        Args:
-            base_spawn_pos: The primary position to check (e.g., minion's spawn point). List [y,x].
-            grid: The current game grid (numpy array) - state before current turn's moves.
-            occupied_by_others_this_turn: A list of [y, x] positions (lists) that other minions
-                                           will definitively occupy in the current turn resolution.
-        Returns:
-            An available [y, x] position (list).
-        """
-        base_spawn_pos_tuple = tuple(base_spawn_pos)
-        is_base_spawn_occupied_by_other = any(base_spawn_pos_tuple == tuple(occ_pos) for occ_pos in occupied_by_others_this_turn)
-
-        if not is_base_spawn_occupied_by_other:
-            return base_spawn_pos[:] # Return a copy
-
-        # If base_spawn_pos is occupied by another, try adjacent cells
-        adj_diffs = [(0, 1), (0, -1), (1, 0), (-1, 0)] # Right, Left, Down, Up
-        random.shuffle(adj_diffs) 
-
-        for dr, dc in adj_diffs:
-            adj_pos_y, adj_pos_x = base_spawn_pos[0] + dr, base_spawn_pos[1] + dc
-            
-            if 0 <= adj_pos_y < GRID_HEIGHT and 0 <= adj_pos_x < GRID_WIDTH:
-                adj_pos = [adj_pos_y, adj_pos_x]
-                adj_pos_tuple = tuple(adj_pos)
-                is_adj_occupied_by_other = any(adj_pos_tuple == tuple(occ_pos) for occ_pos in occupied_by_others_this_turn)
-                
-                # Check if the grid cell is EMPTY and not occupied by another minion
-                if grid[adj_pos_y][adj_pos_x] == EMPTY and not is_adj_occupied_by_other:
-                    return adj_pos 
-        
-        # Fallback: if spawn is taken AND no empty, non-taken adjacent spot is found
-        print(f"Warning: Minion bumped to {base_spawn_pos}, which was occupied by another winner, and no suitable adjacent empty cell found. Defaulting to {base_spawn_pos}.")
-        return base_spawn_pos[:] # Return a copy
+    def resolve_collisions(self, intended, powers, tiebreak, spawns):
+        """Resolve contested cells for (N, 2) intended positions against the pre-turn grid"""
+        # Each bumped minion tries the four neighbours of its spawn in its own random order
+        directions = [MOVE_UP, MOVE_DOWN, MOVE_LEFT, MOVE_RIGHT]
+        adj_orders = np.array([random.sample(directions, len(directions)) for _ in range(len(intended))], dtype=np.int64)
+        return resolve_collisions(intended, powers, tiebreak, spawns, self.grid, MOVE_TABLE, adj_orders)
 
     def next_turn(self):
         """Move to the next turn"""